@@ -46,6 +46,9 @@ class Application:
         self.provider_choice = provider_choice.lower()
         self.Session = None
         self.engine = None
+        self.async_qdrant_client = None
+        self.embedding_cache = None
+        self.boundary_detector = None
     
     def setup_database(self):
         """Initialize database connection and create tables."""
@@ -53,10 +56,20 @@ class Application:
         
         # Create engine
         db_url = settings.get_database_url()
+        engine_kwargs = {}
+        if db_url.startswith("postgresql"):
+            # Batch executemany() (bulk inserts) into multi-row statements
+            engine_kwargs["executemany_mode"] = "values_plus_batch"
+        
         self.engine = create_engine(
             db_url,
             pool_pre_ping=True,
-            echo=False
+            echo=False,
+            # Rows per multi-row INSERT page; sized for ingestion bursts
+            insertmanyvalues_page_size=1000,
+            # Compiled-statement cache entries (default 500)
+            query_cache_size=1200,
+            **engine_kwargs
         )
         
         # Create tables
@@ -77,12 +90,32 @@ class Application:
         from src.services.ollama_client import OllamaClient
         ollama_client = OllamaClient()
         
-        # Qdrant client for analysis layer
-        from qdrant_client import QdrantClient
+        # Optional Redis-backed embedding cache for idea embeddings
+        embedding_client = ollama_client
+        if settings.embedding_cache_enabled:
+            from redis.asyncio import Redis
+            from src.services.embedding_cache import EmbeddingCache
+            embedding_client = EmbeddingCache(ollama_client, Redis.from_url(settings.redis_url))
+            self.embedding_cache = embedding_client
+            logger.info("Embedding cache enabled")
+        
+        # Qdrant clients for analysis layer (async client serves coroutine paths)
+        import httpx
+        from qdrant_client import QdrantClient, AsyncQdrantClient
         qdrant_client = QdrantClient(
             host=settings.qdrant_host,
-            port=settings.qdrant_port
+            port=settings.qdrant_port,
+            grpc_port=settings.qdrant_grpc_port,
+            prefer_grpc=settings.qdrant_prefer_grpc
+        )
+        async_qdrant_client = AsyncQdrantClient(
+            host=settings.qdrant_host,
+            port=settings.qdrant_port,
+            grpc_port=settings.qdrant_grpc_port,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            limits=httpx.Limits(max_connections=settings.qdrant_max_connections)
         )
+        self.async_qdrant_client = async_qdrant_client
         
         # Enrichment repositories
         from src.repositories.speaker_alias_repo import SpeakerAliasRepository
@@ -92,7 +125,7 @@ class Application:
         
         speaker_alias_repo = SpeakerAliasRepository(self.Session)
         enrichment_queue_repo = EnrichmentQueueRepository(self.Session)
-        idea_repo = IdeaRepository(qdrant_client, ollama_client)
+        idea_repo = IdeaRepository(qdrant_client, embedding_client, async_qdrant_client)
         exchange_repo = ExchangeRepository(qdrant_client, ollama_client)
         
         # Boundary detector and model manager
@@ -273,6 +306,7 @@ class Application:
         
         # Store worker for later initialization
         self.enrichment_worker = worker
+        self.boundary_detector = boundary_detector
         self.idea_repo = idea_repo
         self.exchange_repo = exchange_repo
         
@@ -296,6 +330,9 @@ class Application:
             await self.exchange_repo.initialize_collection()
             logger.info("Qdrant collections initialized")
             
+            # Start boundary detection worker
+            await self.boundary_detector.start()
+            
             # Start enrichment worker
             if settings.enrichment_worker_enabled:
                 asyncio.create_task(self.enrichment_worker.start())
@@ -321,6 +358,15 @@ class Application:
             if self.bot:
                 await self.bot.close()
             
+            if self.boundary_detector:
+                await self.boundary_detector.stop()
+            
+            if self.async_qdrant_client:
+                await self.async_qdrant_client.close()
+            
+            if self.embedding_cache:
+                await self.embedding_cache.close()
+            
             if self.Session:
                 self.Session.remove()
             
@@ -0,0 +1,8 @@
+-- Migration 005: Add composite index for session message queries
+-- Date: 2026-10-16
+-- Description: Lets get_messages_by_session filter by session and read in timestamp order from the index
+
+-- Channel and user queries are already served by idx_message_channel_time and
+-- idx_message_user_time (btree indexes are scanned backwards for ORDER BY ... DESC)
+CREATE INDEX IF NOT EXISTS idx_message_session_time 
+ON messages(session_id, timestamp);
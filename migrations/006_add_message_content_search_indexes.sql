@@ -0,0 +1,13 @@
+-- Migration 006: Add content search indexes for messages
+-- Date: 2026-10-16
+-- Description: GIN indexes so message text search avoids sequential scans
+
+-- Trigram index: accelerates the existing ILIKE '%...%' substring search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_message_content_trgm 
+ON messages USING GIN (content gin_trgm_ops);
+
+-- Full-text index: serves word/phrase search via search_messages_fts
+CREATE INDEX IF NOT EXISTS idx_message_content_fts 
+ON messages USING GIN (to_tsvector('english', content));
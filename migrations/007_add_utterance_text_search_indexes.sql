@@ -0,0 +1,13 @@
+-- Migration 007: Add text search indexes for utterances
+-- Date: 2026-10-16
+-- Description: GIN indexes so utterance text search avoids sequential scans
+
+-- Trigram index: accelerates the existing ILIKE '%...%' substring search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_utterance_text_trgm 
+ON utterances USING GIN (text gin_trgm_ops);
+
+-- Full-text index: serves word/phrase search via search_utterances_fts
+CREATE INDEX IF NOT EXISTS idx_utterance_text_fts 
+ON utterances USING GIN (to_tsvector('english', text));
@@ -0,0 +1,14 @@
+-- Migration 008: Covering and time-range indexes for utterances
+-- Date: 2026-10-16
+-- Description: Rebuild the (session_id, started_at) index with INCLUDE columns
+--              and add a (started_at, ended_at) index for time-range queries
+
+-- Requires PostgreSQL 11+ for INCLUDE
+DROP INDEX IF EXISTS idx_utterance_session_time;
+
+CREATE INDEX IF NOT EXISTS idx_utterance_session_time 
+ON utterances (session_id, started_at) 
+INCLUDE (id, user_id, username, confidence, audio_duration);
+
+CREATE INDEX IF NOT EXISTS idx_utterance_time_range 
+ON utterances (started_at, ended_at);
@@ -7,6 +7,7 @@ import logging
 from src.services.transcription import TranscriptionService
 from src.services.session_manager import SessionManager
 from src.repositories.message_repo import MessageRepository
+from src.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +117,10 @@ class DiscordBot(commands.Bot):
         
         # Track which channels we're recording
         self._recording_channels = set()
+        
+        # Text messages waiting to be written in one batch
+        self._message_buffer = []
+        self._message_flush_task = None
     
     async def setup_hook(self):
         """Called when bot is starting up."""
@@ -126,6 +131,7 @@ class DiscordBot(commands.Bot):
         await self.transcription_service.start_monitor()
         logger.info("Starting session manager monitor...")
         await self.session_manager.start_timeout_monitor()
+        self._start_message_flush()
         logger.info("Background services started")
     
     async def on_ready(self):
@@ -139,6 +145,7 @@ class DiscordBot(commands.Bot):
             await self.transcription_service.start_monitor()
             logger.info("Starting session manager monitor...")
             await self.session_manager.start_timeout_monitor()
+            self._start_message_flush()
             logger.info("Background services started")
         
         # Sync slash commands
@@ -175,20 +182,56 @@ class DiscordBot(commands.Bot):
                         session_id = self.session_manager.get_active_session(vc.id)
                         break
             
-            self.message_repo.create_message(
-                message_id=message.id,
-                channel_id=message.channel.id,
-                user_id=message.author.id,
-                username=message.author.name,
-                display_name=message.author.display_name or message.author.name,
-                content=message.content,
-                timestamp=message.created_at,
-                session_id=session_id,
-                reply_to_message_id=message.reference.message_id if message.reference else None
-            )
+            self._message_buffer.append({
+                'message_id': message.id,
+                'channel_id': message.channel.id,
+                'user_id': message.author.id,
+                'username': message.author.name,
+                'display_name': message.author.display_name or message.author.name,
+                'content': message.content,
+                'timestamp': message.created_at,
+                'session_id': session_id,
+                'reply_to_message_id': message.reference.message_id if message.reference else None
+            })
+            
+            if len(self._message_buffer) >= settings.message_batch_size:
+                self._flush_messages()
         except Exception as e:
             logger.error(f"Failed to store message: {e}")
     
+    def _start_message_flush(self):
+        """Start the periodic message buffer flush (idempotent)."""
+        if not self._message_flush_task:
+            self._message_flush_task = asyncio.create_task(self._message_flush_loop())
+    
+    async def _message_flush_loop(self):
+        """Periodically write buffered messages so none wait indefinitely."""
+        while True:
+            try:
+                await asyncio.sleep(settings.message_flush_interval_sec)
+                self._flush_messages()
+            except asyncio.CancelledError:
+                break
+    
+    def _flush_messages(self):
+        """Write all buffered messages in a single transaction."""
+        if not self._message_buffer:
+            return
+        
+        rows, self._message_buffer = self._message_buffer, []
+        try:
+            self.message_repo.create_messages_bulk(rows)
+            return
+        except Exception as e:
+            logger.warning(f"Batch insert of {len(rows)} messages failed, retrying individually: {e}")
+        
+        # Fall back to one insert per message so a single bad row only loses itself
+        for row in rows:
+            try:
+                self.message_repo.create_message(**row)
+            except Exception as e:
+                logger.error(f"Failed to store message {row['message_id']}: {e}")
+    
     async def on_voice_state_update(
         self,
         member: discord.Member,
@@ -345,6 +388,7 @@ class DiscordBot(commands.Bot):
             
             # Flush all buffers
             await self.transcription_service.flush_all_buffers(channel.id)
+            self._flush_messages()
             
             self._recording_channels.discard(channel.id)
             logger.info(f"Stopped recording channel: {channel.name}")
@@ -373,4 +417,9 @@ class DiscordBot(commands.Bot):
         await self.transcription_service.stop_monitor()
         await self.session_manager.stop_timeout_monitor()
         
+        if self._message_flush_task:
+            self._message_flush_task.cancel()
+            self._message_flush_task = None
+        self._flush_messages()
+        
         await super().close()
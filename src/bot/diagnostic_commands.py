@@ -76,7 +76,7 @@ class DiagnosticCommands(commands.Cog):
             
             # Ideas count
             if session_id:
-                ideas = self.idea_repo.get_ideas_by_session(session_id, limit=1000)
+                ideas = await self.idea_repo.get_ideas_by_session_async(session_id, limit=None)
                 embed.add_field(
                     name="💡 Ideas (Current Session)",
                     value=f"{len(ideas)} ideas created",
@@ -271,7 +271,7 @@ class DiagnosticCommands(commands.Cog):
                 return
             
             # Get ideas
-            ideas = self.idea_repo.get_ideas_by_session(session_id, limit=100)
+            ideas = await self.idea_repo.get_ideas_by_session_async(session_id, limit=100)
             
             if not ideas:
                 await ctx.respond("⚠️ No ideas found in session", ephemeral=True)
@@ -69,6 +69,13 @@ class Settings(BaseSettings):
     qdrant_collection: str = "utterances"
     qdrant_api_key: Optional[str] = None
     
+    # Use gRPC (lower per-call overhead than REST) on qdrant_grpc_port
+    qdrant_prefer_grpc: bool = True
+    qdrant_grpc_port: int = 6334
+    
+    # Connection pool size for the async Qdrant client
+    qdrant_max_connections: int = 32
+    
     # =========================================================================
     # Audio Processing Configuration
     # =========================================================================
@@ -102,6 +109,9 @@ class Settings(BaseSettings):
     # Maximum keywords to extract by default
     analysis_default_keyword_limit: int = 20
     
+    # Sessions whose utterances are memoized by the analyzer
+    analysis_utterance_cache_size: int = 32
+    
     # =========================================================================
     # Performance Configuration
     # =========================================================================
@@ -111,6 +121,12 @@ class Settings(BaseSettings):
     # Maximum concurrent transcriptions
     transcription_max_concurrent: int = 5
     
+    # Text messages are buffered and written in batches of this size
+    message_batch_size: int = 256
+    
+    # Maximum seconds a buffered message waits before being written
+    message_flush_interval_sec: float = 2.0
+    
     # =========================================================================
     # Logging Configuration
     # =========================================================================
@@ -134,6 +150,19 @@ class Settings(BaseSettings):
     ollama_chat_model: str = "phi3:mini"
     ollama_embed_model: str = "nomic-embed-text"
     
+    # =========================================================================
+    # Embedding Cache Configuration (Redis)
+    # =========================================================================
+    # Cache embeddings in Redis (requires the optional Redis service)
+    embedding_cache_enabled: bool = False
+    redis_url: str = "redis://:redis@localhost:6379/0"
+    embedding_cache_ttl_sec: int = 86400
+    
+    # Semantic cache for idea searches (near-identical queries reuse results)
+    idea_query_cache_enabled: bool = False
+    idea_query_cache_score_threshold: float = 0.97
+    idea_query_cache_ttl_sec: int = 300
+    
     # =========================================================================
     # Enrichment Engine Configuration
     # =========================================================================
@@ -144,6 +173,11 @@ class Settings(BaseSettings):
     # Idea boundary detection
     idea_boundary_silence_ms: int = 800
     idea_max_duration_sec: int = 60
+    # Cap on buffered utterances per speaker. Ideas normally form after 3, so the
+    # buffer only fills when idea creation keeps failing; at the cap the buffer is
+    # flushed into an idea, and if that also fails the oldest utterance is dropped
+    # with a warning.
+    idea_max_utterances: int = 50
     
     # Response mapping
     response_mapping_time_threshold_ms: int = 5000
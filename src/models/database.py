@@ -1,6 +1,6 @@
 from sqlalchemy import (
     Column, Integer, String, Float, DateTime, ForeignKey, 
-    BigInteger, Text, Index, Enum as SQLEnum, Boolean
+    BigInteger, Text, Index, Enum as SQLEnum, Boolean, DDL, event, text, func
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.declarative import declarative_base
@@ -11,6 +11,13 @@ import uuid
 
 Base = declarative_base()
 
+# Trigram indexes need pg_trgm before tables are created
+event.listen(
+    Base.metadata,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+)
+
 
 class SessionStatus(enum.Enum):
     """Session lifecycle states."""
@@ -83,10 +90,23 @@ class UtteranceModel(Base):
     # Relationships
     session = relationship("SessionModel", back_populates="utterances")
     
+    # Fetch server-generated values (id, sequence_num) via INSERT ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+    
     __table_args__ = (
         Index('idx_utterance_user_time', 'user_id', 'started_at'),
-        Index('idx_utterance_session_time', 'session_id', 'started_at'),
+        # Covers get_conversation_stats (index-only scan); text is left out
+        # because long values could exceed the btree tuple size limit
+        Index('idx_utterance_session_time', 'session_id', 'started_at',
+              postgresql_include=['id', 'user_id', 'username', 'confidence', 'audio_duration']),
+        Index('idx_utterance_time_range', 'started_at', 'ended_at'),
         Index('idx_utterances_prosody', 'prosody', postgresql_using='gin'),
+        # Trigram index so ILIKE '%...%' searches avoid sequential scans
+        Index('idx_utterance_text_trgm', 'text', postgresql_using='gin',
+              postgresql_ops={'text': 'gin_trgm_ops'}),
+        # Full-text index for search_utterances_fts
+        Index('idx_utterance_text_fts', text("to_tsvector('english', text)"),
+              postgresql_using='gin'),
     )
 
 
@@ -110,6 +130,13 @@ class MessageModel(Base):
     __table_args__ = (
         Index('idx_message_channel_time', 'channel_id', 'timestamp'),
         Index('idx_message_user_time', 'user_id', 'timestamp'),
+        Index('idx_message_session_time', 'session_id', 'timestamp'),
+        # Trigram index so ILIKE '%...%' searches avoid sequential scans
+        Index('idx_message_content_trgm', 'content', postgresql_using='gin',
+              postgresql_ops={'content': 'gin_trgm_ops'}),
+        # Full-text index for search_messages_fts
+        Index('idx_message_content_fts', text("to_tsvector('english', content)"),
+              postgresql_using='gin'),
     )
 
 
@@ -122,12 +149,17 @@ class SpeakerAliasModel(Base):
     alias = Column(Text, nullable=False)
     alias_type = Column(String(20), nullable=False)  # username, display_name, nickname, mention
     confidence = Column(Float, default=1.0)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=text("timezone('utc', now())"))
     created_by = Column(BigInteger, nullable=True)
     
+    # Fetch server-generated values (id, created_at) via INSERT ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+    
     __table_args__ = (
         Index('idx_speaker_aliases_user_id', 'user_id'),
-        Index('idx_speaker_aliases_alias', 'alias'),
+        # Functional indexes matching the case-insensitive lookups (see migration 003)
+        Index('idx_speaker_aliases_alias', func.lower(alias)),
+        Index('idx_speaker_aliases_user_alias', user_id, func.lower(alias), unique=True),
     )
 
 
@@ -1,19 +1,59 @@
 """Qdrant collection schemas for analysis layer."""
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import (
+    Distance,
+    VectorParams,
+    PointStruct,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType
+)
 import uuid
 
 
 # Collection names
 IDEAS_COLLECTION = "ideas"
 EXCHANGES_COLLECTION = "exchanges"
+QUERY_CACHE_COLLECTION = "query_cache"
+
+# Named vector on the ideas collection
+IDEA_CONTENT_VECTOR = "content"  # Embedding of the idea text
 
 
 def get_idea_collection_config() -> Dict[str, Any]:
     """
     Get configuration for ideas collection.
     
+    Ideas use a named vector so additional representations can be added to
+    the same point later without a new collection. Original
+    float32 vectors live on disk; searches run against int8
+    scalar-quantized copies kept in RAM.
+    
+    Returns:
+        Collection configuration dict
+    """
+    return {
+        "vectors_config": {
+            IDEA_CONTENT_VECTOR: VectorParams(
+                size=768,  # nomic-embed-text dimension
+                distance=Distance.COSINE,
+                on_disk=True
+            )
+        },
+        "quantization_config": ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8,
+                always_ram=True
+            )
+        )
+    }
+
+
+def get_exchange_collection_config() -> Dict[str, Any]:
+    """
+    Get configuration for exchanges collection.
+    
     Returns:
         Collection configuration dict
     """
@@ -25,9 +65,9 @@ def get_idea_collection_config() -> Dict[str, Any]:
     }
 
 
-def get_exchange_collection_config() -> Dict[str, Any]:
+def get_query_cache_collection_config() -> Dict[str, Any]:
     """
-    Get configuration for exchanges collection.
+    Get configuration for the semantic query cache collection.
     
     Returns:
         Collection configuration dict
@@ -135,12 +175,17 @@ def create_exchange_payload(
 
 
 class IdeaPoint:
-    """Domain model for an Idea point in Qdrant."""
+    """
+    Domain model for an Idea point in Qdrant.
+    
+    vector is None unless requested, otherwise a dict of named vectors (or a
+    plain list for ideas collections still on the legacy unnamed layout).
+    """
     
     def __init__(
         self,
         id: str,
-        vector: List[float],
+        vector: Optional[Union[Dict[str, List[float]], List[float]]],
         payload: Dict[str, Any]
     ):
         self.id = id
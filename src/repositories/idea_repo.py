@@ -1,16 +1,31 @@
 """Repository for Idea operations in Qdrant."""
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, AsyncIterator, Set, Tuple
 from datetime import datetime
+import itertools
 import logging
+import time
 import uuid
 
-from qdrant_client import QdrantClient
-from qdrant_client.models import PointStruct, Filter, FieldCondition, MatchValue
+from qdrant_client import QdrantClient, AsyncQdrantClient
+from qdrant_client.models import (
+    PointStruct,
+    Filter,
+    FieldCondition,
+    MatchValue,
+    Range,
+    QueryRequest,
+    SetPayload,
+    SetPayloadOperation,
+    FilterSelector
+)
 
 from src.models.qdrant_schema import (
     IDEAS_COLLECTION,
+    QUERY_CACHE_COLLECTION,
+    IDEA_CONTENT_VECTOR,
     IdeaPoint,
     get_idea_collection_config,
+    get_query_cache_collection_config,
     create_idea_payload
 )
 from src.services.ollama_client import OllamaClient
@@ -18,43 +33,123 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Points fetched per scroll request when paginating large result sets
+SCROLL_PAGE_SIZE = 256
+
+# Namespace for deterministic query cache point ids
+_QUERY_CACHE_NAMESPACE = uuid.UUID("6f1c7a52-3d0e-4b8a-9f27-5e4d1c2b8a90")
+
 
 class IdeaRepository:
     """Repository for Idea operations in Qdrant (analysis layer)."""
     
-    def __init__(self, qdrant_client: QdrantClient, ollama_client: OllamaClient):
+    # Collections already verified/created in this process
+    _initialized: Set[str] = set()
+    
+    # Vector name used by each ideas collection; None for collections created
+    # before ideas moved to named vectors, which keep their unnamed vector
+    _content_vectors: Dict[str, Optional[str]] = {}
+    
+    def __init__(
+        self,
+        qdrant_client: QdrantClient,
+        ollama_client: OllamaClient,
+        async_qdrant_client: AsyncQdrantClient
+    ):
+        """
+        Initialize idea repository.
+        
+        Args:
+            qdrant_client: Blocking Qdrant client (used by sync methods)
+            ollama_client: OllamaClient instance for embeddings
+            async_qdrant_client: Async Qdrant client (used by async methods so
+                network calls don't block the event loop)
+        """
         self.qdrant = qdrant_client
+        self.async_qdrant = async_qdrant_client
         self.ollama = ollama_client
         self.collection_name = IDEAS_COLLECTION
+        # Monotonic time of the last expired query cache purge
+        self._query_cache_purged_at = 0.0
     
     async def initialize_collection(self) -> bool:
         """
-        Initialize the ideas collection if it doesn't exist.
+        Initialize the ideas collection (and query cache, if enabled) if missing.
         
         Returns:
             True if successful, False otherwise
+            
+        Raises:
+            RuntimeError: If an existing ideas collection has an unknown vector layout
         """
         try:
-            # Check if collection exists
-            collections = self.qdrant.get_collections().collections
-            exists = any(c.name == self.collection_name for c in collections)
-            
-            if not exists:
-                config = get_idea_collection_config()
-                self.qdrant.create_collection(
-                    collection_name=self.collection_name,
-                    vectors_config=config["vectors_config"]
-                )
-                logger.info(f"Created Qdrant collection: {self.collection_name}")
-            else:
-                logger.info(f"Qdrant collection already exists: {self.collection_name}")
+            collections = [(self.collection_name, get_idea_collection_config())]
+            if settings.idea_query_cache_enabled:
+                collections.append((QUERY_CACHE_COLLECTION, get_query_cache_collection_config()))
+            
+            for name, config in collections:
+                if name in self._initialized:
+                    continue
+                
+                if not await self.async_qdrant.collection_exists(name):
+                    await self.async_qdrant.create_collection(
+                        collection_name=name,
+                        vectors_config=config["vectors_config"],
+                        quantization_config=config.get("quantization_config")
+                    )
+                    logger.info(f"Created Qdrant collection: {name}")
+                else:
+                    logger.info(f"Qdrant collection already exists: {name}")
+                    if name == self.collection_name:
+                        self._content_vectors[name] = await self._detect_content_vector()
+                
+                self._initialized.add(name)
             
             return True
             
+        except RuntimeError:
+            raise
         except Exception as e:
             logger.error(f"Failed to initialize ideas collection: {e}")
             return False
     
+    async def _detect_content_vector(self) -> Optional[str]:
+        """
+        Work out which vector an existing ideas collection stores embeddings in.
+        
+        Collections created before ideas moved to named vectors have a single
+        unnamed vector. They keep working as-is: writes and searches against
+        them simply omit the vector name.
+        
+        Returns:
+            IDEA_CONTENT_VECTOR for the named layout, None for the legacy layout
+            
+        Raises:
+            RuntimeError: If the collection has named vectors but no IDEA_CONTENT_VECTOR
+        """
+        info = await self.async_qdrant.get_collection(self.collection_name)
+        vectors = info.config.params.vectors
+        if not isinstance(vectors, dict):
+            logger.info(
+                f"Qdrant collection '{self.collection_name}' uses the legacy unnamed "
+                f"vector layout; keeping it"
+            )
+            return None
+        if IDEA_CONTENT_VECTOR in vectors:
+            return IDEA_CONTENT_VECTOR
+        
+        message = (
+            f"Qdrant collection '{self.collection_name}' has named vectors "
+            f"{sorted(vectors)} but no '{IDEA_CONTENT_VECTOR}' vector"
+        )
+        logger.error(message)
+        raise RuntimeError(message)
+    
+    @property
+    def _content_vector(self) -> Optional[str]:
+        """Vector name for idea embeddings (None for the legacy unnamed layout)."""
+        return self._content_vectors.get(self.collection_name, IDEA_CONTENT_VECTOR)
+    
     async def create_idea(
         self,
         utterance_ids: List[int],
@@ -105,12 +200,12 @@ class IdeaRepository:
             # Create point
             point = PointStruct(
                 id=idea_id,
-                vector=embedding,
+                vector={self._content_vector: embedding} if self._content_vector else embedding,
                 payload=payload
             )
             
             # Insert into Qdrant
-            self.qdrant.upsert(
+            await self.async_qdrant.upsert(
                 collection_name=self.collection_name,
                 points=[point]
             )
@@ -122,12 +217,13 @@ class IdeaRepository:
             logger.error(f"Failed to create idea: {e}")
             return None
     
-    def get_idea(self, idea_id: str) -> Optional[IdeaPoint]:
+    def get_idea(self, idea_id: str, with_vectors: bool = False) -> Optional[IdeaPoint]:
         """
         Retrieve an idea by UUID.
         
         Args:
             idea_id: Idea UUID
+            with_vectors: Whether to include embedding vectors
             
         Returns:
             IdeaPoint if found, None otherwise
@@ -136,7 +232,7 @@ class IdeaRepository:
             points = self.qdrant.retrieve(
                 collection_name=self.collection_name,
                 ids=[idea_id],
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True
             )
             
@@ -154,6 +250,119 @@ class IdeaRepository:
             logger.error(f"Failed to get idea {idea_id}: {e}")
             return None
     
+    async def get_idea_async(
+        self,
+        idea_id: str,
+        with_vectors: bool = False
+    ) -> Optional[IdeaPoint]:
+        """
+        Retrieve an idea by UUID without blocking the event loop.
+        
+        Args:
+            idea_id: Idea UUID
+            with_vectors: Whether to include embedding vectors
+            
+        Returns:
+            IdeaPoint if found, None otherwise
+        """
+        try:
+            points = await self.async_qdrant.retrieve(
+                collection_name=self.collection_name,
+                ids=[idea_id],
+                with_vectors=with_vectors,
+                with_payload=True
+            )
+            
+            if not points:
+                return None
+            
+            point = points[0]
+            return IdeaPoint(
+                id=str(point.id),
+                vector=point.vector,
+                payload=point.payload
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to get idea {idea_id}: {e}")
+            return None
+    
+    def get_ideas(
+        self,
+        idea_ids: List[str],
+        with_vectors: bool = False
+    ) -> List[IdeaPoint]:
+        """
+        Retrieve several ideas by UUID in a single request.
+        
+        Args:
+            idea_ids: Idea UUIDs
+            with_vectors: Whether to include embedding vectors
+            
+        Returns:
+            IdeaPoints found, in the order of idea_ids (missing ideas are skipped)
+        """
+        if not idea_ids:
+            return []
+        
+        try:
+            points = self.qdrant.retrieve(
+                collection_name=self.collection_name,
+                ids=idea_ids,
+                with_vectors=with_vectors,
+                with_payload=True
+            )
+            return self._order_points(idea_ids, points)
+            
+        except Exception as e:
+            logger.error(f"Failed to get {len(idea_ids)} ideas: {e}")
+            return []
+    
+    async def get_ideas_async(
+        self,
+        idea_ids: List[str],
+        with_vectors: bool = False
+    ) -> List[IdeaPoint]:
+        """
+        Retrieve several ideas by UUID in a single request without blocking the event loop.
+        
+        Args:
+            idea_ids: Idea UUIDs
+            with_vectors: Whether to include embedding vectors
+            
+        Returns:
+            IdeaPoints found, in the order of idea_ids (missing ideas are skipped)
+        """
+        if not idea_ids:
+            return []
+        
+        try:
+            points = await self.async_qdrant.retrieve(
+                collection_name=self.collection_name,
+                ids=idea_ids,
+                with_vectors=with_vectors,
+                with_payload=True
+            )
+            return self._order_points(idea_ids, points)
+            
+        except Exception as e:
+            logger.error(f"Failed to get {len(idea_ids)} ideas: {e}")
+            return []
+    
+    @staticmethod
+    def _order_points(idea_ids: List[str], points) -> List[IdeaPoint]:
+        """Convert retrieved points to IdeaPoints in the order of idea_ids."""
+        by_id = {str(p.id): p for p in points}
+        return [
+            IdeaPoint(
+                id=idea_id,
+                vector=by_id[idea_id].vector,
+                payload=by_id[idea_id].payload
+            )
+            for idea_id in idea_ids
+            if idea_id in by_id
+        ]
+    
     def update_enrichments(
         self,
         idea_id: str,
@@ -170,37 +379,38 @@ class IdeaRepository:
             True if successful, False otherwise
         """
         try:
-            # Qdrant doesn't support partial updates directly, need to get and update
-            idea = self.get_idea(idea_id)
-            if not idea:
-                logger.warning(f"Idea {idea_id} not found for update")
-                return False
-            
-            # Update payload
-            payload = idea.payload.copy()
-            for key, value in enrichment_dict.items():
-                # Handle nested keys (e.g., "enrichment_status.alias_detection")
-                if '.' in key:
-                    parts = key.split('.')
-                    current = payload
-                    for part in parts[:-1]:
-                        if part not in current:
-                            current[part] = {}
-                        current = current[part]
-                    current[parts[-1]] = value
-                else:
-                    payload[key] = value
-            
-            # Update point
-            point = PointStruct(
-                id=idea_id,
-                vector=idea.vector,
-                payload=payload
+            # Partial payload updates in one request; the vector is never read or rewritten
+            self.qdrant.batch_update_points(
+                collection_name=self.collection_name,
+                update_operations=self._enrichment_operations(idea_id, enrichment_dict)
             )
             
-            self.qdrant.upsert(
+            logger.debug(f"Updated enrichments for idea {idea_id}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to update enrichments for idea {idea_id}: {e}")
+            return False
+    
+    async def update_enrichments_async(
+        self,
+        idea_id: str,
+        enrichment_dict: Dict[str, Any]
+    ) -> bool:
+        """
+        Partially update enrichment fields for an idea without blocking the event loop.
+        
+        Args:
+            idea_id: Idea UUID
+            enrichment_dict: Dict of fields to update (supports nested keys with dot notation)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self.async_qdrant.batch_update_points(
                 collection_name=self.collection_name,
-                points=[point]
+                update_operations=self._enrichment_operations(idea_id, enrichment_dict)
             )
             
             logger.debug(f"Updated enrichments for idea {idea_id}")
@@ -210,55 +420,245 @@ class IdeaRepository:
             logger.error(f"Failed to update enrichments for idea {idea_id}: {e}")
             return False
     
+    async def bulk_update_enrichments_async(
+        self,
+        updates: List[Tuple[str, Dict[str, Any]]]
+    ) -> bool:
+        """
+        Partially update enrichment fields for several ideas in one request.
+        
+        Args:
+            updates: (idea_id, enrichment_dict) pairs; enrichment_dict supports
+                nested keys with dot notation
+            
+        Returns:
+            True if the whole batch was applied, False otherwise
+        """
+        if not updates:
+            return True
+        
+        try:
+            await self.async_qdrant.batch_update_points(
+                collection_name=self.collection_name,
+                update_operations=[
+                    operation
+                    for idea_id, enrichment_dict in updates
+                    for operation in self._enrichment_operations(idea_id, enrichment_dict)
+                ]
+            )
+            
+            logger.debug(f"Updated enrichments for {len(updates)} ideas")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to update enrichments for {len(updates)} ideas: {e}")
+            return False
+    
+    @classmethod
+    def _enrichment_operations(
+        cls,
+        idea_id: str,
+        enrichment_dict: Dict[str, Any]
+    ) -> List[SetPayloadOperation]:
+        """
+        Build set-payload operations applying enrichment fields to one idea.
+        
+        Args:
+            idea_id: Idea UUID
+            enrichment_dict: Dict of fields to update (supports nested keys with dot notation)
+            
+        Returns:
+            One SetPayloadOperation per payload key touched
+        """
+        return [
+            SetPayloadOperation(
+                set_payload=SetPayload(payload=payload, key=key, points=[idea_id])
+            )
+            for key, payload in cls._group_enrichments(enrichment_dict).items()
+        ]
+    
+    @staticmethod
+    def _group_enrichments(
+        enrichment_dict: Dict[str, Any]
+    ) -> Dict[Optional[str], Dict[str, Any]]:
+        """
+        Group enrichment fields by the payload key they are written under.
+        
+        Flat keys are grouped under None (top-level payload). Dot-notation keys
+        (e.g., "enrichment_status.alias_detection") are grouped under their
+        parent path so they can be written with set_payload's nested ``key``.
+        
+        Args:
+            enrichment_dict: Dict of fields to update (supports nested keys with dot notation)
+            
+        Returns:
+            Dict mapping parent key (or None) to the payload to set under it
+        """
+        grouped: Dict[Optional[str], Dict[str, Any]] = {}
+        for key, value in enrichment_dict.items():
+            parent, _, field = key.rpartition('.')
+            grouped.setdefault(parent or None, {})[field] = value
+        return grouped
+    
+    def iter_ideas_by_session(
+        self,
+        session_id: str,
+        page_size: int = SCROLL_PAGE_SIZE,
+        with_vectors: bool = False
+    ) -> Iterator[IdeaPoint]:
+        """
+        Stream all ideas for a session using cursor-based scroll pagination.
+        
+        Args:
+            session_id: Session ID
+            page_size: Number of points fetched per scroll request
+            with_vectors: Whether to include embedding vectors
+            
+        Yields:
+            IdeaPoint objects
+        """
+        offset = None
+        while True:
+            points, offset = self.qdrant.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=self._session_filter(session_id),
+                limit=page_size,
+                offset=offset,
+                with_vectors=with_vectors,
+                with_payload=True
+            )
+            
+            for p in points:
+                yield IdeaPoint(
+                    id=str(p.id),
+                    vector=p.vector,
+                    payload=p.payload
+                )
+            
+            if offset is None:
+                return
+    
     def get_ideas_by_session(
         self,
         session_id: str,
-        limit: int = 100
+        limit: Optional[int] = 100,
+        with_vectors: bool = False
     ) -> List[IdeaPoint]:
         """
         Get all ideas for a session.
         
         Args:
             session_id: Session ID
-            limit: Maximum number of ideas to return
+            limit: Maximum number of ideas to return (None for all)
+            with_vectors: Whether to include embedding vectors
             
         Returns:
             List of IdeaPoint objects
         """
         try:
-            results = self.qdrant.scroll(
-                collection_name=self.collection_name,
-                scroll_filter=Filter(
-                    must=[
-                        FieldCondition(
-                            key="session_id",
-                            match=MatchValue(value=session_id)
-                        )
-                    ]
+            page_size = min(limit, SCROLL_PAGE_SIZE) if limit else SCROLL_PAGE_SIZE
+            return list(itertools.islice(
+                self.iter_ideas_by_session(
+                    session_id,
+                    page_size=page_size,
+                    with_vectors=with_vectors
                 ),
-                limit=limit,
-                with_vectors=True,
+                limit
+            ))
+            
+        except Exception as e:
+            logger.error(f"Failed to get ideas for session {session_id}: {e}")
+            return []
+    
+    async def iter_ideas_by_session_async(
+        self,
+        session_id: str,
+        page_size: int = SCROLL_PAGE_SIZE,
+        with_vectors: bool = False
+    ) -> AsyncIterator[IdeaPoint]:
+        """
+        Stream all ideas for a session without blocking the event loop.
+        
+        Args:
+            session_id: Session ID
+            page_size: Number of points fetched per scroll request
+            with_vectors: Whether to include embedding vectors
+            
+        Yields:
+            IdeaPoint objects
+        """
+        offset = None
+        while True:
+            points, offset = await self.async_qdrant.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=self._session_filter(session_id),
+                limit=page_size,
+                offset=offset,
+                with_vectors=with_vectors,
                 with_payload=True
             )
             
-            points, _ = results
-            return [
-                IdeaPoint(
+            for p in points:
+                yield IdeaPoint(
                     id=str(p.id),
                     vector=p.vector,
                     payload=p.payload
                 )
-                for p in points
-            ]
+            
+            if offset is None:
+                return
+    
+    async def get_ideas_by_session_async(
+        self,
+        session_id: str,
+        limit: Optional[int] = 100,
+        with_vectors: bool = False
+    ) -> List[IdeaPoint]:
+        """
+        Get all ideas for a session without blocking the event loop.
+        
+        Args:
+            session_id: Session ID
+            limit: Maximum number of ideas to return (None for all)
+            with_vectors: Whether to include embedding vectors
+            
+        Returns:
+            List of IdeaPoint objects
+        """
+        try:
+            page_size = min(limit, SCROLL_PAGE_SIZE) if limit else SCROLL_PAGE_SIZE
+            ideas = []
+            async for idea in self.iter_ideas_by_session_async(
+                session_id,
+                page_size=page_size,
+                with_vectors=with_vectors
+            ):
+                ideas.append(idea)
+                if limit and len(ideas) >= limit:
+                    break
+            return ideas
             
         except Exception as e:
             logger.error(f"Failed to get ideas for session {session_id}: {e}")
             return []
     
+    @staticmethod
+    def _session_filter(session_id: str) -> Filter:
+        """Build a payload filter matching ideas in a session."""
+        return Filter(
+            must=[
+                FieldCondition(
+                    key="session_id",
+                    match=MatchValue(value=session_id)
+                )
+            ]
+        )
+    
     def get_ideas_needing_enrichment(
         self,
         task_type: str,
-        limit: int = 100
+        limit: int = 100,
+        with_vectors: bool = False
     ) -> List[IdeaPoint]:
         """
         Get ideas that need a specific enrichment.
@@ -266,6 +666,7 @@ class IdeaRepository:
         Args:
             task_type: Enrichment task type (e.g., 'alias_detection')
             limit: Maximum number of ideas to return
+            with_vectors: Whether to include embedding vectors
             
         Returns:
             List of IdeaPoint objects
@@ -283,7 +684,7 @@ class IdeaRepository:
                     ]
                 ),
                 limit=limit,
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True
             )
             
@@ -306,7 +707,8 @@ class IdeaRepository:
         query_text: str,
         limit: int = 10,
         session_id: Optional[str] = None,
-        user_id: Optional[int] = None
+        user_id: Optional[int] = None,
+        with_vectors: bool = False
     ) -> List[IdeaPoint]:
         """
         Search for similar ideas using semantic search.
@@ -316,6 +718,7 @@ class IdeaRepository:
             limit: Maximum number of results
             session_id: Optional session filter
             user_id: Optional user filter
+            with_vectors: Whether to include embedding vectors
             
         Returns:
             List of IdeaPoint objects ordered by similarity
@@ -331,36 +734,28 @@ class IdeaRepository:
                 logger.error("Failed to generate query embedding")
                 return []
             
-            # Build filter
-            filter_conditions = []
-            if session_id:
-                filter_conditions.append(
-                    FieldCondition(
-                        key="session_id",
-                        match=MatchValue(value=session_id)
-                    )
-                )
-            if user_id:
-                filter_conditions.append(
-                    FieldCondition(
-                        key="user_id",
-                        match=MatchValue(value=user_id)
-                    )
-                )
+            search_filter = self._build_search_filter(session_id, user_id)
             
-            search_filter = Filter(must=filter_conditions) if filter_conditions else None
+            # Serve near-identical recent queries from the semantic cache
+            cache_scope = f"{session_id}:{user_id}:{limit}"
+            if settings.idea_query_cache_enabled:
+                cached = await self._lookup_query_cache(embedding, cache_scope, with_vectors)
+                if cached is not None:
+                    return cached
             
             # Search
-            results = self.qdrant.search(
+            results = await self.async_qdrant.search(
                 collection_name=self.collection_name,
-                query_vector=embedding,
+                query_vector=(
+                    (self._content_vector, embedding) if self._content_vector else embedding
+                ),
                 query_filter=search_filter,
                 limit=limit,
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True
             )
             
-            return [
+            ideas = [
                 IdeaPoint(
                     id=str(r.id),
                     vector=r.vector,
@@ -369,10 +764,232 @@ class IdeaRepository:
                 for r in results
             ]
             
+            if settings.idea_query_cache_enabled:
+                await self._store_query_cache(
+                    query_text, embedding, cache_scope, [idea.id for idea in ideas]
+                )
+            
+            return ideas
+            
         except Exception as e:
             logger.error(f"Failed to search similar ideas: {e}")
             return []
     
+    async def search_similar_batch(
+        self,
+        queries: List[str],
+        limit: int = 10,
+        session_id: Optional[str] = None,
+        user_id: Optional[int] = None,
+        with_vectors: bool = False
+    ) -> List[List[IdeaPoint]]:
+        """
+        Search for similar ideas for several queries in a single request.
+        
+        Args:
+            queries: Texts to search for
+            limit: Maximum number of results per query
+            session_id: Optional session filter
+            user_id: Optional user filter
+            with_vectors: Whether to include embedding vectors
+            
+        Returns:
+            One list of IdeaPoint objects (ordered by similarity) per query
+        """
+        if not queries:
+            return []
+        
+        try:
+            embeddings = await self.ollama.embed_batch(
+                model=settings.ollama_embed_model,
+                texts=queries
+            )
+            
+            if not embeddings:
+                logger.error("Failed to generate query embeddings")
+                return [[] for _ in queries]
+            
+            search_filter = self._build_search_filter(session_id, user_id)
+            requests = [
+                QueryRequest(
+                    query=embedding,
+                    using=self._content_vector,
+                    filter=search_filter,
+                    limit=limit,
+                    with_payload=True,
+                    with_vector=with_vectors
+                )
+                for embedding in embeddings
+            ]
+            
+            responses = await self.async_qdrant.query_batch_points(
+                collection_name=self.collection_name,
+                requests=requests
+            )
+            
+            return [
+                [
+                    IdeaPoint(
+                        id=str(p.id),
+                        vector=p.vector,
+                        payload=p.payload
+                    )
+                    for p in response.points
+                ]
+                for response in responses
+            ]
+            
+        except Exception as e:
+            logger.error(f"Failed to batch search similar ideas: {e}")
+            return [[] for _ in queries]
+    
+    @staticmethod
+    def _build_search_filter(
+        session_id: Optional[str],
+        user_id: Optional[int]
+    ) -> Optional[Filter]:
+        """Build an optional session/user payload filter for similarity search."""
+        filter_conditions = []
+        if session_id:
+            filter_conditions.append(
+                FieldCondition(
+                    key="session_id",
+                    match=MatchValue(value=session_id)
+                )
+            )
+        if user_id:
+            filter_conditions.append(
+                FieldCondition(
+                    key="user_id",
+                    match=MatchValue(value=user_id)
+                )
+            )
+        
+        return Filter(must=filter_conditions) if filter_conditions else None
+    
+    async def _lookup_query_cache(
+        self,
+        embedding: List[float],
+        scope: str,
+        with_vectors: bool = False
+    ) -> Optional[List[IdeaPoint]]:
+        """
+        Look up cached results for a semantically equivalent query.
+        
+        Args:
+            embedding: Query embedding
+            scope: Cache scope key (session, user and limit of the query)
+            with_vectors: Whether to include embedding vectors
+            
+        Returns:
+            Cached IdeaPoints in original rank order, or None on cache miss
+        """
+        try:
+            hits = await self.async_qdrant.search(
+                collection_name=QUERY_CACHE_COLLECTION,
+                query_vector=embedding,
+                query_filter=Filter(
+                    must=[
+                        FieldCondition(key="scope", match=MatchValue(value=scope)),
+                        FieldCondition(
+                            key="cached_at",
+                            range=Range(gte=time.time() - settings.idea_query_cache_ttl_sec)
+                        )
+                    ]
+                ),
+                score_threshold=settings.idea_query_cache_score_threshold,
+                limit=1,
+                with_payload=True
+            )
+            
+            if not hits:
+                return None
+            
+            idea_ids = hits[0].payload.get("idea_ids", [])
+            if not idea_ids:
+                return []
+            
+            points = await self.async_qdrant.retrieve(
+                collection_name=self.collection_name,
+                ids=idea_ids,
+                with_vectors=with_vectors,
+                with_payload=True
+            )
+            return self._order_points(idea_ids, points)
+            
+        except Exception as e:
+            logger.warning(f"Query cache lookup failed: {e}")
+            return None
+    
+    async def _store_query_cache(
+        self,
+        query_text: str,
+        embedding: List[float],
+        scope: str,
+        idea_ids: List[str]
+    ) -> None:
+        """
+        Store search results in the semantic query cache.
+        
+        The point id is derived from the normalized query text and scope, so
+        repeating a query overwrites its entry instead of adding a duplicate.
+        Expired entries are purged at most once per TTL period.
+        
+        Args:
+            query_text: Original query text
+            embedding: Query embedding
+            scope: Cache scope key (session, user and limit of the query)
+            idea_ids: Result idea UUIDs in rank order
+        """
+        normalized = " ".join(query_text.lower().split())
+        point_id = str(uuid.uuid5(_QUERY_CACHE_NAMESPACE, f"{scope}\n{normalized}"))
+        try:
+            await self.async_qdrant.upsert(
+                collection_name=QUERY_CACHE_COLLECTION,
+                points=[
+                    PointStruct(
+                        id=point_id,
+                        vector=embedding,
+                        payload={
+                            "scope": scope,
+                            "idea_ids": idea_ids,
+                            "cached_at": time.time()
+                        }
+                    )
+                ]
+            )
+        except Exception as e:
+            logger.warning(f"Query cache store failed: {e}")
+            return
+        
+        await self._purge_expired_query_cache()
+    
+    async def _purge_expired_query_cache(self) -> None:
+        """Delete query cache entries older than the TTL, at most once per TTL."""
+        ttl = settings.idea_query_cache_ttl_sec
+        now = time.monotonic()
+        if now - self._query_cache_purged_at < ttl:
+            return
+        self._query_cache_purged_at = now
+        
+        try:
+            await self.async_qdrant.delete(
+                collection_name=QUERY_CACHE_COLLECTION,
+                points_selector=FilterSelector(
+                    filter=Filter(
+                        must=[
+                            FieldCondition(
+                                key="cached_at",
+                                range=Range(lt=time.time() - ttl)
+                            )
+                        ]
+                    )
+                ),
+                wait=False
+            )
+        except Exception as e:
+            logger.warning(f"Query cache purge failed: {e}")
+    
     def get_previous_idea(
         self,
         session_id: str,
@@ -391,22 +1008,50 @@ class IdeaRepository:
             IdeaPoint if found, None otherwise
         """
         try:
-            # Get all ideas for session (Qdrant doesn't support timestamp comparisons in filters)
-            ideas = self.get_ideas_by_session(session_id, limit=1000)
-            
-            # Filter and sort in Python
-            filtered = [
-                idea for idea in ideas
-                if idea.ended_at < before_timestamp
-                and (user_id is None or idea.user_id != user_id)  # Different speaker
-            ]
+            # Stream ideas for session (Qdrant doesn't support timestamp comparisons in filters)
+            previous = None
+            for idea in self.iter_ideas_by_session(session_id):
+                if idea.ended_at >= before_timestamp:
+                    continue
+                if user_id is not None and idea.user_id == user_id:  # Different speaker
+                    continue
+                if previous is None or idea.ended_at > previous.ended_at:
+                    previous = idea
             
-            if not filtered:
-                return None
+            return previous
+            
+        except Exception as e:
+            logger.error(f"Failed to get previous idea: {e}")
+            return None
+    
+    async def get_previous_idea_async(
+        self,
+        session_id: str,
+        before_timestamp: datetime,
+        user_id: Optional[int] = None
+    ) -> Optional[IdeaPoint]:
+        """
+        Async variant of get_previous_idea for use inside the event loop.
+        
+        Args:
+            session_id: Session ID
+            before_timestamp: Timestamp to search before
+            user_id: Optional user filter
+            
+        Returns:
+            IdeaPoint if found, None otherwise
+        """
+        try:
+            previous = None
+            async for idea in self.iter_ideas_by_session_async(session_id):
+                if idea.ended_at >= before_timestamp:
+                    continue
+                if user_id is not None and idea.user_id == user_id:  # Different speaker
+                    continue
+                if previous is None or idea.ended_at > previous.ended_at:
+                    previous = idea
             
-            # Sort by ended_at descending and return first
-            filtered.sort(key=lambda x: x.ended_at, reverse=True)
-            return filtered[0]
+            return previous
             
         except Exception as e:
             logger.error(f"Failed to get previous idea: {e}")
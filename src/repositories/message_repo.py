@@ -1,3 +1,4 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session, scoped_session
 from typing import List, Optional
 from datetime import datetime
@@ -41,8 +42,35 @@ class MessageRepository:
             session_id=session_id,
             reply_to_message_id=reply_to_message_id
         )
-        self.db.add(message)
-        self.db.commit()
+        db = self.db
+        try:
+            db.add(message)
+            db.commit()
+        except Exception:
+            # Don't leave the shared session unusable for other repositories
+            db.rollback()
+            raise
+    
+    def create_messages_bulk(self, rows: List[dict]) -> None:
+        """
+        Create many messages in a single transaction.
+        
+        On failure the transaction is rolled back and the error re-raised;
+        none of the rows are stored.
+        
+        Args:
+            rows: Dicts keyed by MessageModel column names
+        """
+        if not rows:
+            return
+        
+        db = self.db
+        try:
+            db.bulk_insert_mappings(MessageModel, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
     
     def get_messages_by_session(
         self,
@@ -128,6 +156,32 @@ class MessageRepository:
         
         return [self._to_domain(m) for m in messages]
     
+    def search_messages_fts(
+        self,
+        text_query: str,
+        channel_id: Optional[int] = None,
+        session_id: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Message]:
+        """Search messages by full-text match (word/phrase level, stemmed)."""
+        query = self.db.query(MessageModel).filter(
+            func.to_tsvector('english', MessageModel.content).op('@@')(
+                func.plainto_tsquery('english', text_query)
+            )
+        )
+        
+        if channel_id:
+            query = query.filter(MessageModel.channel_id == channel_id)
+        
+        if session_id:
+            query = query.filter(MessageModel.session_id == session_id)
+        
+        messages = query.order_by(
+            MessageModel.timestamp.desc()
+        ).limit(limit).all()
+        
+        return [self._to_domain(m) for m in messages]
+    
     def _to_domain(self, message: MessageModel) -> Message:
         """Convert database model to domain model."""
         return Message(
@@ -1,7 +1,10 @@
-from sqlalchemy.orm import Session, scoped_session
+from sqlalchemy.orm import Session, scoped_session, selectinload
 from sqlalchemy import select
-from typing import Optional, List
+from typing import Optional, List, Iterator, Dict, Tuple
+from contextlib import contextmanager
 from datetime import datetime
+import threading
+import time
 import uuid
 
 from src.models.database import SessionModel, ParticipantModel, SessionStatus
@@ -11,13 +14,34 @@ from src.models.domain import Session as DomainSession, Participant, SessionStat
 class SessionRepository:
     """Repository for session-related database operations."""
     
+    # Seconds a cached get_active_session result stays valid
+    _ACTIVE_TTL = 2.0
+    
     def __init__(self, session_factory: scoped_session):
         self.session_factory = session_factory
+        # Plain sessionmaker behind the shared registry, so per-call sessions
+        # never touch the thread-local session other repositories are using
+        self._make_session = session_factory.session_factory
+        # channel_id -> (active session_id or None, monotonic cache time)
+        self._active_cache: Dict[int, Tuple[Optional[str], float]] = {}
+        self._active_lock = threading.Lock()
     
-    @property
-    def db(self) -> Session:
-        """Get a fresh database session."""
-        return self.session_factory()
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        """
+        Provide a session scoped to one repository call.
+        
+        Commits on success, rolls back on error, and always closes the
+        session so its connection is returned to the pool. The session is
+        private to the call; the shared scoped_session registry is left alone.
+        """
+        with self._make_session() as db:
+            try:
+                yield db
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
     
     def create_session(
         self,
@@ -40,34 +64,58 @@ class SessionRepository:
             started_at=datetime.utcnow(),
             status=SessionStatus.ACTIVE
         )
-        self.db.add(session)
-        self.db.commit()
+        with self._session() as db:
+            db.add(session)
+        self._invalidate_active(channel_id)
         return session_id
     
     def end_session(self, session_id: str, status: SessionStatus = SessionStatus.ENDED) -> None:
         """Mark a session as ended."""
-        session = self.db.query(SessionModel).filter(
-            SessionModel.session_id == session_id
-        ).first()
+        with self._session() as db:
+            session = db.query(SessionModel).filter(
+                SessionModel.session_id == session_id
+            ).first()
+            
+            if session:
+                session.ended_at = datetime.utcnow()
+                session.status = status
+                channel_id = session.channel_id
+            else:
+                channel_id = None
         
-        if session:
-            session.ended_at = datetime.utcnow()
-            session.status = status
-            self.db.commit()
+        if channel_id is not None:
+            self._invalidate_active(channel_id)
     
     def get_active_session(self, channel_id: int) -> Optional[str]:
         """
         Get active session ID for a channel.
         
+        Results are cached per channel for _ACTIVE_TTL seconds.
+        
         Returns:
             session_id or None if no active session
         """
-        session = self.db.query(SessionModel).filter(
-            SessionModel.channel_id == channel_id,
-            SessionModel.status == SessionStatus.ACTIVE
-        ).first()
+        now = time.monotonic()
+        with self._active_lock:
+            cached = self._active_cache.get(channel_id)
+        if cached is not None and now - cached[1] < self._ACTIVE_TTL:
+            return cached[0]
         
-        return session.session_id if session else None
+        with self._session() as db:
+            session = db.query(SessionModel).filter(
+                SessionModel.channel_id == channel_id,
+                SessionModel.status == SessionStatus.ACTIVE
+            ).first()
+            session_id = session.session_id if session else None
+        
+        with self._active_lock:
+            self._active_cache[channel_id] = (session_id, now)
+        return session_id
+    
+    def _invalidate_active(self, channel_id: int) -> None:
+        """Drop the cached active session for a channel."""
+        with self._active_lock:
+            self._active_cache.pop(channel_id, None)
     
     def add_participant(
         self,
@@ -84,8 +132,8 @@ class SessionRepository:
             display_name=display_name,
             joined_at=datetime.utcnow()
         )
-        self.db.add(participant)
-        self.db.commit()
+        with self._session() as db:
+            db.add(participant)
     
     def remove_participant(
         self,
@@ -93,46 +141,53 @@ class SessionRepository:
         user_id: int
     ) -> None:
         """Mark a participant as having left the session."""
-        participant = self.db.query(ParticipantModel).filter(
-            ParticipantModel.session_id == session_id,
-            ParticipantModel.user_id == user_id,
-            ParticipantModel.left_at.is_(None)
-        ).first()
-        
-        if participant:
-            participant.left_at = datetime.utcnow()
-            self.db.commit()
+        with self._session() as db:
+            participant = db.query(ParticipantModel).filter(
+                ParticipantModel.session_id == session_id,
+                ParticipantModel.user_id == user_id,
+                ParticipantModel.left_at.is_(None)
+            ).first()
+            
+            if participant:
+                participant.left_at = datetime.utcnow()
     
     def get_session(self, session_id: str) -> Optional[DomainSession]:
         """Get a session with all its participants."""
-        session = self.db.query(SessionModel).filter(
-            SessionModel.session_id == session_id
-        ).first()
-        
-        if not session:
-            return None
+        with self._session() as db:
+            session = db.query(SessionModel).options(
+                selectinload(SessionModel.participants)
+            ).filter(
+                SessionModel.session_id == session_id
+            ).first()
+            
+            if not session:
+                return None
+            
+            return self._to_domain(session)
+    
+    def get_sessions_by_ids(self, session_ids: List[str]) -> Dict[str, DomainSession]:
+        """
+        Get several sessions in one query.
         
-        participants = [
-            Participant(
-                user_id=p.user_id,
-                username=p.username,
-                display_name=p.display_name,
-                joined_at=p.joined_at,
-                left_at=p.left_at
-            )
-            for p in session.participants
-        ]
+        Args:
+            session_ids: Session IDs to fetch; unknown IDs are skipped
+            
+        Returns:
+            Dict of session_id -> session, ordered by start time
+        """
+        if not session_ids:
+            return {}
         
-        return DomainSession(
-            session_id=session.session_id,
-            channel_id=session.channel_id,
-            channel_name=session.channel_name,
-            guild_id=session.guild_id,
-            started_at=session.started_at,
-            ended_at=session.ended_at,
-            status=DomainSessionStatus(session.status.value),
-            participants=participants
-        )
+        with self._session() as db:
+            sessions = db.query(SessionModel).options(
+                selectinload(SessionModel.participants)
+            ).filter(
+                SessionModel.session_id.in_(session_ids)
+            ).order_by(
+                SessionModel.started_at
+            ).all()
+            
+            return {s.session_id: self._to_domain(s) for s in sessions}
     
     def get_sessions_by_channel(
         self,
@@ -140,21 +195,27 @@ class SessionRepository:
         limit: int = 10
     ) -> List[DomainSession]:
         """Get recent sessions for a channel."""
-        sessions = self.db.query(SessionModel).filter(
-            SessionModel.channel_id == channel_id
-        ).order_by(
-            SessionModel.started_at.desc()
-        ).limit(limit).all()
-        
-        return [self._to_domain(s) for s in sessions]
+        with self._session() as db:
+            sessions = db.query(SessionModel).options(
+                selectinload(SessionModel.participants)
+            ).filter(
+                SessionModel.channel_id == channel_id
+            ).order_by(
+                SessionModel.started_at.desc()
+            ).limit(limit).all()
+            
+            return [self._to_domain(s) for s in sessions]
     
     def get_active_sessions(self) -> List[DomainSession]:
         """Get all currently active sessions."""
-        sessions = self.db.query(SessionModel).filter(
-            SessionModel.status == SessionStatus.ACTIVE
-        ).all()
-        
-        return [self._to_domain(s) for s in sessions]
+        with self._session() as db:
+            sessions = db.query(SessionModel).options(
+                selectinload(SessionModel.participants)
+            ).filter(
+                SessionModel.status == SessionStatus.ACTIVE
+            ).all()
+            
+            return [self._to_domain(s) for s in sessions]
     
     def _to_domain(self, session: SessionModel) -> DomainSession:
         """Convert database model to domain model."""
@@ -1,6 +1,8 @@
 """Repository for speaker alias operations."""
+from sqlalchemy import func, select, values, column, exists, literal, Text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session, scoped_session
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set
 from datetime import datetime
 import logging
 
@@ -8,6 +10,17 @@ from src.models.database import SpeakerAliasModel
 
 logger = logging.getLogger(__name__)
 
+# Columns fetched for domain reads, in _row_to_domain order
+_ALIAS_COLUMNS = (
+    SpeakerAliasModel.id,
+    SpeakerAliasModel.user_id,
+    SpeakerAliasModel.alias,
+    SpeakerAliasModel.alias_type,
+    SpeakerAliasModel.confidence,
+    SpeakerAliasModel.created_at,
+    SpeakerAliasModel.created_by,
+)
+
 
 class SpeakerAlias:
     """Domain model for speaker alias."""
@@ -27,12 +40,22 @@ class SpeakerAliasRepository:
     
     def __init__(self, session_factory: scoped_session):
         self.session_factory = session_factory
+        # Cached result of get_all_aliases_map, cleared whenever aliases change
+        self._alias_map_cache: Optional[Dict[str, int]] = None
+        self._alias_map_version = 0
+        # Users already seeded (or found to have aliases) in this process
+        self._seeded_users: Set[int] = set()
     
     @property
     def db(self) -> Session:
         """Get a fresh database session."""
         return self.session_factory()
     
+    @property
+    def alias_map_version(self) -> int:
+        """Counter bumped whenever aliases change, for caching data derived from the alias map."""
+        return self._alias_map_version
+    
     def get_aliases_for_user(self, user_id: int) -> List[SpeakerAlias]:
         """
         Get all aliases for a specific user.
@@ -44,11 +67,11 @@ class SpeakerAliasRepository:
             List of SpeakerAlias objects
         """
         try:
-            aliases = self.db.query(SpeakerAliasModel).filter(
+            rows = self.db.query(*_ALIAS_COLUMNS).filter(
                 SpeakerAliasModel.user_id == user_id
             ).all()
             
-            return [self._to_domain(a) for a in aliases]
+            return [self._row_to_domain(row) for row in rows]
         except Exception as e:
             logger.error(f"Failed to get aliases for user {user_id}: {e}")
             return []
@@ -64,8 +87,6 @@ class SpeakerAliasRepository:
             user_id if found, None otherwise
         """
         try:
-            from sqlalchemy import func
-            
             alias = self.db.query(SpeakerAliasModel).filter(
                 func.lower(SpeakerAliasModel.alias) == alias_text.lower()
             ).first()
@@ -79,16 +100,31 @@ class SpeakerAliasRepository:
         """
         Get all aliases as a map for batch matching.
         
+        The map is cached in-process and rebuilt only after aliases change;
+        callers must treat it as read-only.
+        
         Returns:
             Dict mapping lowercase alias -> user_id
         """
+        if self._alias_map_cache is not None:
+            return self._alias_map_cache
+        
         try:
-            aliases = self.db.query(SpeakerAliasModel).all()
-            return {a.alias.lower(): a.user_id for a in aliases}
+            rows = self.db.query(SpeakerAliasModel).with_entities(
+                SpeakerAliasModel.alias,
+                SpeakerAliasModel.user_id
+            ).all()
+            self._alias_map_cache = {alias.lower(): user_id for alias, user_id in rows}
+            return self._alias_map_cache
         except Exception as e:
             logger.error(f"Failed to get all aliases map: {e}")
             return {}
     
+    def _invalidate_alias_map(self) -> None:
+        """Drop the cached alias map after a mutation."""
+        self._alias_map_cache = None
+        self._alias_map_version += 1
+    
     def add_alias(
         self,
         user_id: int,
@@ -98,7 +134,7 @@ class SpeakerAliasRepository:
         created_by: Optional[int] = None
     ) -> Optional[int]:
         """
-        Add a new alias for a user.
+        Add a new alias for a user (existing aliases are left unchanged).
         
         Args:
             user_id: Discord user ID
@@ -108,35 +144,29 @@ class SpeakerAliasRepository:
             created_by: User ID who created this alias (None if auto-generated)
             
         Returns:
-            Alias ID if successful, None otherwise
+            Alias ID (new or existing) if successful, None otherwise
         """
         try:
-            # Check if alias already exists for this user
-            from sqlalchemy import func
-            existing = self.db.query(SpeakerAliasModel).filter(
-                SpeakerAliasModel.user_id == user_id,
-                func.lower(SpeakerAliasModel.alias) == alias.lower()
-            ).first()
-            
-            if existing:
-                logger.debug(f"Alias '{alias}' already exists for user {user_id}")
-                return existing.id
-            
-            # Create new alias
-            alias_model = SpeakerAliasModel(
+            # Upsert: the no-op update on conflict makes RETURNING yield the
+            # existing row's id, so one statement covers both cases
+            table = SpeakerAliasModel.__table__
+            stmt = insert(SpeakerAliasModel).values(
                 user_id=user_id,
                 alias=alias,
                 alias_type=alias_type,
                 confidence=confidence,
                 created_by=created_by
-            )
+            ).on_conflict_do_update(
+                index_elements=[SpeakerAliasModel.user_id, func.lower(SpeakerAliasModel.alias)],
+                set_={'id': table.c.id}
+            ).returning(SpeakerAliasModel.id)
             
-            self.db.add(alias_model)
+            alias_id = self.db.execute(stmt).scalar()
             self.db.commit()
-            self.db.refresh(alias_model)
+            self._invalidate_alias_map()
             
-            logger.info(f"Added alias '{alias}' ({alias_type}) for user {user_id}")
-            return alias_model.id
+            logger.info(f"Stored alias '{alias}' ({alias_type}) for user {user_id}")
+            return alias_id
             
         except Exception as e:
             self.db.rollback()
@@ -155,8 +185,6 @@ class SpeakerAliasRepository:
             True if removed, False otherwise
         """
         try:
-            from sqlalchemy import func
-            
             deleted = self.db.query(SpeakerAliasModel).filter(
                 SpeakerAliasModel.user_id == user_id,
                 func.lower(SpeakerAliasModel.alias) == alias.lower()
@@ -165,6 +193,7 @@ class SpeakerAliasRepository:
             self.db.commit()
             
             if deleted > 0:
+                self._invalidate_alias_map()
                 logger.info(f"Removed alias '{alias}' for user {user_id}")
                 return True
             else:
@@ -185,53 +214,67 @@ class SpeakerAliasRepository:
         """
         Auto-seed aliases from first utterance by a user.
         
+        Users who already have any alias are left alone, so later display
+        name changes don't add aliases and deliberately removed aliases
+        don't come back. Each user is checked at most once per process.
+        
         Args:
             user_id: Discord user ID
             username: Discord username
             display_name: Discord display name
         """
+        if user_id in self._seeded_users:
+            return
+        
+        rows = []
+        if username:
+            rows.append((username, 'username'))
+        # Add display_name alias if different from username
+        if display_name and (not username or display_name.lower() != username.lower()):
+            rows.append((display_name, 'display_name'))
+        
+        if not rows:
+            return
+        
         try:
-            # Check if user already has aliases
-            existing = self.db.query(SpeakerAliasModel).filter(
-                SpeakerAliasModel.user_id == user_id
-            ).first()
-            
-            if existing:
-                return  # Already seeded
-            
-            # Add username alias
-            if username:
-                self.add_alias(
-                    user_id=user_id,
-                    alias=username,
-                    alias_type='username',
-                    confidence=1.0,
-                    created_by=None
-                )
-            
-            # Add display_name alias if different from username
-            if display_name and display_name.lower() != username.lower():
-                self.add_alias(
-                    user_id=user_id,
-                    alias=display_name,
-                    alias_type='display_name',
-                    confidence=1.0,
-                    created_by=None
+            # Insert only when the user has no aliases yet; the unique
+            # (user_id, lower(alias)) index covers concurrent seeding
+            seed = values(
+                column('alias', Text), column('alias_type', Text), name='seed'
+            ).data(rows)
+            stmt = insert(SpeakerAliasModel).from_select(
+                ['user_id', 'alias', 'alias_type', 'confidence'],
+                select(
+                    literal(user_id, SpeakerAliasModel.user_id.type),
+                    seed.c.alias,
+                    seed.c.alias_type,
+                    literal(1.0, SpeakerAliasModel.confidence.type)
+                ).where(
+                    ~exists().where(SpeakerAliasModel.user_id == user_id)
                 )
+            ).on_conflict_do_nothing(
+                index_elements=[SpeakerAliasModel.user_id, func.lower(SpeakerAliasModel.alias)]
+            )
+            result = self.db.execute(stmt)
+            self.db.commit()
+            self._seeded_users.add(user_id)
             
-            logger.info(f"Auto-seeded aliases for user {user_id} ({username})")
+            if result.rowcount:
+                self._invalidate_alias_map()
+                logger.info(f"Auto-seeded aliases for user {user_id} ({username})")
             
         except Exception as e:
+            self.db.rollback()
             logger.error(f"Failed to auto-seed aliases for user {user_id}: {e}")
     
-    def _to_domain(self, alias: SpeakerAliasModel) -> SpeakerAlias:
-        """Convert database model to domain model."""
+    def _row_to_domain(self, row) -> SpeakerAlias:
+        """Convert an _ALIAS_COLUMNS row tuple to domain model."""
         return SpeakerAlias(
-            id=alias.id,
-            user_id=alias.user_id,
-            alias=alias.alias,
-            alias_type=alias.alias_type,
-            confidence=alias.confidence,
-            created_at=alias.created_at,
-            created_by=alias.created_by
+            id=row[0],
+            user_id=row[1],
+            alias=row[2],
+            alias_type=row[3],
+            confidence=row[4],
+            created_at=row[5],
+            created_by=row[6]
         )
@@ -1,6 +1,10 @@
-from sqlalchemy.orm import Session, scoped_session
-from typing import List, Optional
+from sqlalchemy import select, func, insert
+from sqlalchemy.orm import Session, scoped_session, raiseload
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from typing import List, Optional, Dict, Iterator
 from datetime import datetime
+import io
+import json
 import logging
 
 from src.models.database import UtteranceModel
@@ -8,9 +12,51 @@ from src.models.domain import Utterance
 
 logger = logging.getLogger(__name__)
 
+# Columns fetched for domain reads, in _row_to_domain order
+_UTTERANCE_COLUMNS = (
+    UtteranceModel.id,
+    UtteranceModel.session_id,
+    UtteranceModel.user_id,
+    UtteranceModel.username,
+    UtteranceModel.display_name,
+    UtteranceModel.text,
+    UtteranceModel.started_at,
+    UtteranceModel.ended_at,
+    UtteranceModel.confidence,
+    UtteranceModel.audio_duration,
+)
+
+# Rows fetched per round trip when streaming large result sets
+STREAM_PAGE_SIZE = 1000
+
+# Minimum batch size for which bulk_copy_utterances uses COPY
+COPY_THRESHOLD = 100
+
+_UTTERANCE_COPY_SQL = (
+    "COPY utterances (session_id, user_id, username, display_name, text, "
+    "started_at, ended_at, confidence, audio_duration, sequence_num, prosody) "
+    "FROM STDIN WITH (FORMAT text)"
+)
+
+
+def _copy_escape(value: str) -> str:
+    """Escape a value for COPY text format."""
+    return (
+        value.replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
 
 class UtteranceRepository:
-    """Repository for utterance-related database operations."""
+    """
+    Repository for utterance-related database operations.
+    
+    The bulk paths rely on the engine's executemany batching; on Postgres the
+    engine should be created with executemany_mode='values_plus_batch' and a
+    suitable insertmanyvalues_page_size (see Application.setup_database).
+    """
     
     def __init__(self, session_factory: scoped_session, speaker_alias_repo=None, boundary_detector=None):
         self.session_factory = session_factory
@@ -41,12 +87,16 @@ class UtteranceRepository:
         Returns:
             utterance_id: ID of the created utterance
         """
-        logger.debug(f"Creating utterance for session {session_id}, user {username} ({user_id})")
-        logger.debug(f"Text: \"{text[:100]}...\" Duration: {audio_duration:.2f}s Confidence: {confidence:.2f}")
+        logger.debug("Creating utterance for session %s, user %s (%s)", session_id, username, user_id)
+        logger.debug('Text: "%.100s..." Duration: %.2fs Confidence: %.2f', text, audio_duration, confidence)
         
         try:
-            # Calculate sequence_num
-            sequence_num = self._get_next_sequence_num(session_id)
+            # Assign sequence_num inside the INSERT itself (1-based, per session)
+            sequence_num = select(
+                func.coalesce(func.max(UtteranceModel.sequence_num), 0) + 1
+            ).where(
+                UtteranceModel.session_id == session_id
+            ).scalar_subquery()
             
             utterance = UtteranceModel(
                 session_id=session_id,
@@ -61,10 +111,15 @@ class UtteranceRepository:
                 sequence_num=sequence_num,
                 prosody=prosody
             )
-            self.db.add(utterance)
-            self.db.commit()
-            self.db.refresh(utterance)
-            logger.info(f"Successfully created utterance #{utterance.id} for user {username} ({user_id})")
+            db = self.db
+            db.add(utterance)
+            db.flush()  # INSERT ... RETURNING id
+            utterance_id = utterance.id
+            # Detach so commit doesn't expire the loaded values the boundary
+            # detector reads later (avoids a re-SELECT on first access)
+            db.expunge(utterance)
+            
+            db.commit()
             
             # Auto-seed speaker aliases
             if self.speaker_alias_repo:
@@ -72,51 +127,186 @@ class UtteranceRepository:
                     user_id, username, display_name
                 )
             
-            # Trigger boundary detection (async) - schedule for later execution
+            logger.info("Successfully created utterance #%s for user %s (%s)", utterance_id, username, user_id)
+            
+            # Hand off to the boundary detector worker (async)
             if self.boundary_detector:
-                import asyncio
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        logger.debug(f"Triggering boundary detection for utterance {utterance.id}")
-                        # Check for speaker change boundary
-                        asyncio.create_task(
-                            self.boundary_detector.check_speaker_change(
-                                session_id, user_id, started_at
-                            )
-                        )
-                        # Process current utterance
-                        asyncio.create_task(
-                            self.boundary_detector.on_utterance_created(utterance)
-                        )
-                    else:
-                        logger.warning("Event loop exists but not running, skipping boundary detection")
-                except RuntimeError as e:
-                    # No event loop running, skip boundary detection
-                    logger.warning(f"No event loop running, skipping boundary detection: {e}")
+                if not self.boundary_detector.submit(utterance):
+                    logger.warning("Boundary detector not running, skipping boundary detection")
             else:
                 logger.warning("Boundary detector not initialized!")
             
-            return utterance.id
+            return utterance_id
         except Exception as e:
             logger.error(f"Failed to create utterance: {e}", exc_info=True)
             raise
     
+    def create_utterances_bulk(self, rows: List[dict]) -> List[int]:
+        """
+        Create many utterances in a single transaction.
+        
+        Intended for backfills and replays: sequence numbers are assigned per
+        session in input order, continuing from the current maximum, and no
+        alias seeding or boundary detection is triggered.
+        
+        Args:
+            rows: Dicts keyed by UtteranceModel column names (sequence_num is
+                assigned here and may be omitted)
+            
+        Returns:
+            IDs of the created utterances, in input order
+        """
+        if not rows:
+            return []
+        
+        db = self.db
+        try:
+            mappings = self._assign_sequence_nums(db, rows)
+            
+            stmt = insert(UtteranceModel).returning(
+                UtteranceModel.id, sort_by_parameter_order=True
+            )
+            ids = [r[0] for r in db.execute(stmt, mappings)]
+            db.commit()
+            
+            logger.info(f"Bulk created {len(ids)} utterances")
+            return ids
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to bulk create utterances: {e}", exc_info=True)
+            raise
+    
+    def bulk_copy_utterances(self, rows: List[dict]) -> int:
+        """
+        Import many utterances using Postgres COPY.
+        
+        For archival imports and session replays. Falls back to
+        create_utterances_bulk on other databases or for batches smaller
+        than COPY_THRESHOLD. Like the bulk path, no alias seeding or
+        boundary detection is triggered.
+        
+        Args:
+            rows: Dicts keyed by UtteranceModel column names (sequence_num is
+                assigned here and may be omitted)
+            
+        Returns:
+            Number of utterances imported
+        """
+        if not rows:
+            return 0
+        
+        db = self.db
+        if db.get_bind().dialect.name != 'postgresql' or len(rows) < COPY_THRESHOLD:
+            return len(self.create_utterances_bulk(rows))
+        
+        try:
+            buffer = io.StringIO()
+            for row in self._assign_sequence_nums(db, rows):
+                prosody = row.get('prosody')
+                buffer.write('\t'.join((
+                    _copy_escape(row['session_id']),
+                    str(row['user_id']),
+                    _copy_escape(row['username']),
+                    _copy_escape(row['display_name']),
+                    _copy_escape(row['text']),
+                    row['started_at'].isoformat(),
+                    row['ended_at'].isoformat(),
+                    repr(float(row['confidence'])),
+                    repr(float(row['audio_duration'])),
+                    str(row['sequence_num']),
+                    _copy_escape(json.dumps(prosody)) if prosody is not None else '\\N'
+                )))
+                buffer.write('\n')
+            buffer.seek(0)
+            
+            raw = db.connection().connection
+            with raw.cursor() as cur:
+                cur.copy_expert(_UTTERANCE_COPY_SQL, buffer)
+            db.commit()
+            
+            logger.info(f"Copied {len(rows)} utterances")
+            return len(rows)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to copy utterances: {e}", exc_info=True)
+            raise
+    
+    def _assign_sequence_nums(self, db: Session, rows: List[dict]) -> List[dict]:
+        """
+        Assign per-session sequence numbers in input order.
+        
+        Continues from each session's current maximum using one grouped query.
+        
+        Args:
+            db: Session to query with
+            rows: Utterance row dicts
+            
+        Returns:
+            Copies of rows with sequence_num set
+        """
+        session_ids = {row['session_id'] for row in rows}
+        next_seq: Dict[str, int] = dict(
+            db.query(
+                UtteranceModel.session_id,
+                func.max(UtteranceModel.sequence_num)
+            ).filter(
+                UtteranceModel.session_id.in_(session_ids)
+            ).group_by(UtteranceModel.session_id).all()
+        )
+        
+        mappings = []
+        for row in rows:
+            seq = (next_seq.get(row['session_id']) or 0) + 1
+            next_seq[row['session_id']] = seq
+            mappings.append({**row, 'sequence_num': seq})
+        return mappings
+    
     def get_utterances_by_session(
         self,
         session_id: str,
         limit: Optional[int] = None
     ) -> List[Utterance]:
         """Get all utterances for a session, ordered by time."""
-        query = self.db.query(UtteranceModel).filter(
-            UtteranceModel.session_id == session_id
-        ).order_by(UtteranceModel.started_at)
+        query = self._session_query(session_id)
         
         if limit:
             query = query.limit(limit)
         
-        utterances = query.all()
-        return [self._to_domain(u) for u in utterances]
+        rows = query.all()
+        return [self._row_to_domain(row) for row in rows]
+    
+    def get_latest_sequence_num(self, session_id: str) -> int:
+        """
+        Get the highest sequence number in a session (0 if it has none).
+        
+        Served from the (session_id, sequence_num) index, so it is a cheap way
+        to tell whether a session has gained utterances since a prior read.
+        """
+        return self.db.execute(
+            select(func.coalesce(func.max(UtteranceModel.sequence_num), 0)).where(
+                UtteranceModel.session_id == session_id
+            )
+        ).scalar()
+    
+    def iter_utterances_by_session(
+        self,
+        session_id: str,
+        page_size: int = STREAM_PAGE_SIZE
+    ) -> Iterator[Utterance]:
+        """
+        Stream all utterances for a session, ordered by time.
+        
+        Rows are fetched from a server-side cursor page_size at a time, so
+        memory stays flat for multi-hour sessions.
+        """
+        for row in self._session_query(session_id).yield_per(page_size):
+            yield self._row_to_domain(row)
+    
+    def _session_query(self, session_id: str):
+        """Build the time-ordered utterance query for a session."""
+        return self.db.query(*_UTTERANCE_COLUMNS).filter(
+            UtteranceModel.session_id == session_id
+        ).order_by(UtteranceModel.started_at)
     
     def get_utterances_by_user(
         self,
@@ -125,18 +315,18 @@ class UtteranceRepository:
         limit: int = 100
     ) -> List[Utterance]:
         """Get utterances by a specific user."""
-        query = self.db.query(UtteranceModel).filter(
+        query = self.db.query(*_UTTERANCE_COLUMNS).filter(
             UtteranceModel.user_id == user_id
         )
         
         if session_id:
             query = query.filter(UtteranceModel.session_id == session_id)
         
-        utterances = query.order_by(
+        rows = query.order_by(
             UtteranceModel.started_at.desc()
         ).limit(limit).all()
         
-        return [self._to_domain(u) for u in utterances]
+        return [self._row_to_domain(row) for row in rows]
     
     def get_utterances_in_timerange(
         self,
@@ -145,7 +335,29 @@ class UtteranceRepository:
         session_id: Optional[str] = None
     ) -> List[Utterance]:
         """Get utterances within a time range."""
-        query = self.db.query(UtteranceModel).filter(
+        rows = self._timerange_query(start_time, end_time, session_id).all()
+        return [self._row_to_domain(row) for row in rows]
+    
+    def iter_utterances_in_timerange(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        session_id: Optional[str] = None,
+        page_size: int = STREAM_PAGE_SIZE
+    ) -> Iterator[Utterance]:
+        """Stream utterances within a time range, page_size rows at a time."""
+        query = self._timerange_query(start_time, end_time, session_id)
+        for row in query.yield_per(page_size):
+            yield self._row_to_domain(row)
+    
+    def _timerange_query(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        session_id: Optional[str] = None
+    ):
+        """Build the time-ordered utterance query for a time range."""
+        query = self.db.query(*_UTTERANCE_COLUMNS).filter(
             UtteranceModel.started_at >= start_time,
             UtteranceModel.ended_at <= end_time
         )
@@ -153,8 +365,7 @@ class UtteranceRepository:
         if session_id:
             query = query.filter(UtteranceModel.session_id == session_id)
         
-        utterances = query.order_by(UtteranceModel.started_at).all()
-        return [self._to_domain(u) for u in utterances]
+        return query.order_by(UtteranceModel.started_at)
     
     def search_utterances(
         self,
@@ -164,7 +375,7 @@ class UtteranceRepository:
         limit: int = 50
     ) -> List[Utterance]:
         """Search utterances by text content."""
-        query = self.db.query(UtteranceModel).filter(
+        query = self.db.query(*_UTTERANCE_COLUMNS).filter(
             UtteranceModel.text.ilike(f"%{text_query}%")
         )
         
@@ -174,81 +385,162 @@ class UtteranceRepository:
         if user_id:
             query = query.filter(UtteranceModel.user_id == user_id)
         
-        utterances = query.order_by(
+        rows = query.order_by(
+            UtteranceModel.started_at.desc()
+        ).limit(limit).all()
+        
+        return [self._row_to_domain(row) for row in rows]
+    
+    def search_utterances_fts(
+        self,
+        text_query: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[int] = None,
+        limit: int = 50
+    ) -> List[Utterance]:
+        """Search utterances by full-text match (word/phrase level, stemmed)."""
+        query = self.db.query(*_UTTERANCE_COLUMNS).filter(
+            func.to_tsvector('english', UtteranceModel.text).op('@@')(
+                func.plainto_tsquery('english', text_query)
+            )
+        )
+        
+        if session_id:
+            query = query.filter(UtteranceModel.session_id == session_id)
+        
+        if user_id:
+            query = query.filter(UtteranceModel.user_id == user_id)
+        
+        rows = query.order_by(
             UtteranceModel.started_at.desc()
         ).limit(limit).all()
         
-        return [self._to_domain(u) for u in utterances]
+        return [self._row_to_domain(row) for row in rows]
     
-    def get_conversation_stats(self, session_id: str) -> dict:
+    def get_conversation_stats(self, session_id: str) -> List[dict]:
         """Get statistics about a conversation."""
-        from sqlalchemy import func
+        stats = self.db.execute(
+            select(
+                UtteranceModel.user_id,
+                UtteranceModel.username,
+                func.count(UtteranceModel.id).label('utterance_count'),
+                func.coalesce(func.sum(UtteranceModel.audio_duration), 0.0).label('total_speaking_time'),
+                func.coalesce(func.avg(UtteranceModel.confidence), 0.0).label('avg_confidence')
+            ).where(
+                UtteranceModel.session_id == session_id
+            ).group_by(
+                UtteranceModel.user_id,
+                UtteranceModel.username
+            )
+        ).all()
         
-        stats = self.db.query(
-            UtteranceModel.user_id,
-            UtteranceModel.username,
-            func.count(UtteranceModel.id).label('utterance_count'),
-            func.sum(UtteranceModel.audio_duration).label('total_speaking_time'),
-            func.avg(UtteranceModel.confidence).label('avg_confidence')
-        ).filter(
-            UtteranceModel.session_id == session_id
-        ).group_by(
-            UtteranceModel.user_id,
-            UtteranceModel.username
+        return [dict(row._mapping) for row in stats]
+    
+    def aggregate_by_user(self, session_id: str) -> List[dict]:
+        """
+        Aggregate a session's utterances per speaker in SQL.
+        
+        Args:
+            session_id: Session ID
+            
+        Returns:
+            List of dicts with user_id, username (from the latest utterance),
+            utterance_count, total_speaking_time and avg_confidence, ordered
+            by user_id
+        """
+        rows = self.db.execute(
+            select(
+                UtteranceModel.user_id,
+                # Username from the speaker's latest utterance
+                func.array_agg(
+                    aggregate_order_by(UtteranceModel.username, UtteranceModel.started_at.desc()),
+                    type_=ARRAY(UtteranceModel.username.type)
+                )[1].label('username'),
+                func.count(UtteranceModel.id).label('utterance_count'),
+                func.coalesce(func.sum(UtteranceModel.audio_duration), 0.0).label('total_speaking_time'),
+                func.coalesce(func.avg(UtteranceModel.confidence), 0.0).label('avg_confidence')
+            ).where(
+                UtteranceModel.session_id == session_id
+            ).group_by(
+                UtteranceModel.user_id
+            ).order_by(
+                UtteranceModel.user_id
+            )
         ).all()
         
-        return [
-            {
-                'user_id': s.user_id,
-                'username': s.username,
-                'utterance_count': s.utterance_count,
-                'total_speaking_time': float(s.total_speaking_time or 0),
-                'avg_confidence': float(s.avg_confidence or 0)
-            }
-            for s in stats
-        ]
+        return [dict(row._mapping) for row in rows]
     
-    def get_utterance_by_id(self, utterance_id: int):
+    def aggregate_by_session(
+        self,
+        user_id: int,
+        session_ids: Optional[List[str]] = None,
+        limit: int = 10
+    ) -> List[dict]:
         """
-        Get utterance by ID.
+        Aggregate one user's utterances per session in SQL.
         
         Args:
-            utterance_id: Utterance ID
+            user_id: Discord user ID
+            session_ids: Sessions to include; if None, the user's most
+                recently active sessions are used
+            limit: Maximum sessions when session_ids is None
             
         Returns:
-            UtteranceModel if found, None otherwise
+            List of dicts with session_id, utterance_count,
+            total_speaking_time and avg_confidence
         """
-        return self.db.query(UtteranceModel).filter(
-            UtteranceModel.id == utterance_id
-        ).first()
+        query = select(
+            UtteranceModel.session_id,
+            func.count(UtteranceModel.id).label('utterance_count'),
+            func.coalesce(func.sum(UtteranceModel.audio_duration), 0.0).label('total_speaking_time'),
+            func.coalesce(func.avg(UtteranceModel.confidence), 0.0).label('avg_confidence')
+        ).where(
+            UtteranceModel.user_id == user_id
+        ).group_by(
+            UtteranceModel.session_id
+        )
+        
+        if session_ids:
+            query = query.where(UtteranceModel.session_id.in_(session_ids))
+        else:
+            query = query.order_by(
+                func.max(UtteranceModel.started_at).desc()
+            ).limit(limit)
+        
+        rows = self.db.execute(query).all()
+        return [dict(row._mapping) for row in rows]
     
-    def _get_next_sequence_num(self, session_id: str) -> int:
+    def get_utterance_by_id(self, utterance_id: int):
         """
-        Get next sequence number for session.
+        Get utterance by ID.
         
         Args:
-            session_id: Session ID
+            utterance_id: Utterance ID
             
+        Relationships are not loadable on the returned instance, so callers
+        that need related rows must fetch them explicitly rather than
+        triggering a lazy load per utterance.
+        
         Returns:
-            Next sequence number (1-based)
+            UtteranceModel if found, None otherwise
         """
-        from sqlalchemy import func
-        max_seq = self.db.query(func.max(UtteranceModel.sequence_num)).filter(
-            UtteranceModel.session_id == session_id
-        ).scalar()
-        return (max_seq or 0) + 1
+        return self.db.query(UtteranceModel).options(
+            raiseload('*')
+        ).filter(
+            UtteranceModel.id == utterance_id
+        ).first()
     
-    def _to_domain(self, utterance: UtteranceModel) -> Utterance:
-        """Convert database model to domain model."""
+    def _row_to_domain(self, row) -> Utterance:
+        """Convert a _UTTERANCE_COLUMNS row tuple to domain model."""
         return Utterance(
-            utterance_id=utterance.id,
-            session_id=utterance.session_id,
-            user_id=utterance.user_id,
-            username=utterance.username,
-            display_name=utterance.display_name,
-            text=utterance.text,
-            started_at=utterance.started_at,
-            ended_at=utterance.ended_at,
-            confidence=utterance.confidence,
-            audio_duration=utterance.audio_duration
+            utterance_id=row[0],
+            session_id=row[1],
+            user_id=row[2],
+            username=row[3],
+            display_name=row[4],
+            text=row[5],
+            started_at=row[6],
+            ended_at=row[7],
+            confidence=row[8],
+            audio_duration=row[9]
         )
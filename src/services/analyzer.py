@@ -1,8 +1,12 @@
-from typing import List, Dict, Optional, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Set, FrozenSet, NamedTuple
 from datetime import datetime, timedelta
-from collections import defaultdict, Counter
-import statistics
+from collections import defaultdict, Counter, OrderedDict
+from operator import attrgetter, itemgetter
+import heapq
 import re
+import threading
+
+import numpy as np
 
 from src.repositories.session_repo import SessionRepository
 from src.repositories.utterance_repo import UtteranceRepository
@@ -11,6 +15,80 @@ from src.models.domain import Session, Utterance, Message
 from src.config import settings
 
 
+# Common words filtered out of keyword extraction
+_KEYWORD_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'is', 'was', 'are', 'were', 'been', 'be', 'have', 'has',
+    'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'can',
+    'may', 'might', 'must', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
+    'this', 'that', 'these', 'those', 'my', 'your', 'his', 'her', 'its',
+    'our', 'their', 'me', 'him', 'her', 'us', 'them', 'what', 'which',
+    'who', 'when', 'where', 'why', 'how', 'all', 'each', 'every', 'both',
+    'few', 'more', 'most', 'other', 'some', 'such', 'no', 'not', 'only',
+    'own', 'same', 'so', 'than', 'too', 'very', 'just', 'like', 'yeah',
+    'um', 'uh', 'oh', 'okay', 'ok', 'well'
+})
+
+# Keyword stopwords plus filler verbs and adverbs, for topic and timeline analysis
+_TOPIC_STOPWORDS = _KEYWORD_STOPWORDS | frozenset({
+    'now', 'then', 'there', 'here', 'get', 'got', 'going', 'go', 'went',
+    'think', 'know', 'mean', 'see', 'said', 'say', 'really', 'actually',
+    'basically', 'literally'
+})
+
+# Whitespace-separated tokens that are 3+ letters (any script) once the
+# punctuation str.strip()ped by the original tokenizer is trimmed from both ends
+_KEYWORD_RE = re.compile(r'(?<!\S)[.,!?;:"\'()\[\]{}]*([^\W\d_]{3,})[.,!?;:"\'()\[\]{}]*(?!\S)')
+
+
+def _keyword_tokens(text: str) -> List[str]:
+    """
+    Lowercase text and return its keyword candidates in one regex pass.
+    
+    Equivalent to splitting on whitespace, stripping .,!?;:"'()[]{} from each
+    token and keeping tokens of 3+ characters that are entirely alphabetic,
+    so contractions, elisions, hyphenated words and URLs are dropped whole.
+    """
+    return [word for word in _KEYWORD_RE.findall(text.lower()) if word.isalpha()]
+
+
+# Everything but letters, digits and whitespace (squeezed out of topic words)
+_NON_WORD_RE = re.compile(r'[^\w\s]|_')
+
+
+def _topic_tokens(text: str) -> List[str]:
+    """
+    Lowercase text and return its topic words.
+    
+    Punctuation is squeezed out of each whitespace-separated token before
+    filtering, so "don't" becomes "dont" and "well-known" becomes
+    "wellknown"; tokens must then be 3+ characters and entirely alphabetic.
+    """
+    return [
+        word for word in _NON_WORD_RE.sub('', text.lower()).split()
+        if len(word) > 2 and word.isalpha()
+    ]
+
+
+# Utterance fields extracted by _prepare, in column order
+_PREP_FIELDS = attrgetter(
+    'user_id', 'username', 'started_at', 'ended_at', 'audio_duration', 'confidence', 'text'
+)
+
+
+class PreparedUtterances(NamedTuple):
+    """Column-oriented view of a session's utterances, shared across analyzers."""
+    count: int
+    user_codes: np.ndarray  # Dense speaker code (0..K-1) per utterance
+    unique_ids: np.ndarray  # user_id for each speaker code
+    names: List[str]  # Latest username for each speaker code
+    started_ns: np.ndarray  # int64 ns since epoch
+    ended_ns: np.ndarray  # int64 ns since epoch
+    durations: np.ndarray  # float64 seconds
+    confidences: np.ndarray  # float64
+    texts: List[str]
+
+
 class ConversationAnalyzer:
     """
     Service for analyzing conversation dynamics and social patterns.
@@ -26,6 +104,84 @@ class ConversationAnalyzer:
         self.session_repo = session_repo
         self.utterance_repo = utterance_repo
         self.message_repo = message_repo
+        
+        # session_id -> (latest sequence_num, utterances), least recently used first
+        self._utt_cache: "OrderedDict[str, Tuple[int, List[Utterance]]]" = OrderedDict()
+        self._utt_cache_lock = threading.Lock()
+    
+    # =========================================================================
+    # Utterance Cache
+    # =========================================================================
+    
+    def _get_utterances_cached(self, session_id: str) -> List[Utterance]:
+        """
+        Get a session's utterances, reusing a previous fetch when still current.
+        
+        Each lookup checks the session's latest sequence number (an index-only
+        query), so an entry is refetched as soon as a live session gains an
+        utterance. The cache holds at most ``analysis_utterance_cache_size``
+        sessions.
+        
+        Args:
+            session_id: Session ID
+            
+        Returns:
+            Time-ordered utterances for the session
+        """
+        latest_seq = self.utterance_repo.get_latest_sequence_num(session_id)
+        with self._utt_cache_lock:
+            entry = self._utt_cache.get(session_id)
+            if entry is not None and entry[0] == latest_seq:
+                self._utt_cache.move_to_end(session_id)
+                return entry[1]
+        
+        utterances = self.utterance_repo.get_utterances_by_session(session_id)
+        
+        with self._utt_cache_lock:
+            self._utt_cache[session_id] = (latest_seq, utterances)
+            self._utt_cache.move_to_end(session_id)
+            while len(self._utt_cache) > settings.analysis_utterance_cache_size:
+                self._utt_cache.popitem(last=False)
+        
+        return utterances
+    
+    # =========================================================================
+    # Shared Preparation
+    # =========================================================================
+    
+    def _prepare(self, utterances: List[Utterance]) -> PreparedUtterances:
+        """
+        Convert utterances to column arrays once for reuse across analyzers.
+        
+        Args:
+            utterances: Time-ordered utterances for one session
+            
+        Returns:
+            PreparedUtterances bundle
+        """
+        # One attribute fetch per utterance, transposed into columns
+        user_ids, usernames, started, ended, durations, confidences, texts = (
+            list(zip(*map(_PREP_FIELDS, utterances))) or [()] * 7
+        )
+        
+        id_array = np.array(user_ids, dtype=np.int64)
+        unique_ids, user_codes = np.unique(id_array, return_inverse=True)
+        # Latest username per speaker (same rule as aggregate_by_user):
+        # first occurrence in the reversed array is the last one overall
+        _, reversed_first = np.unique(id_array[::-1], return_index=True)
+        last_idx = len(utterances) - 1 - reversed_first
+        
+        return PreparedUtterances(
+            count=len(utterances),
+            user_codes=user_codes,
+            unique_ids=unique_ids,
+            names=[usernames[i] for i in last_idx.tolist()],
+            started_ns=np.array(started, dtype='datetime64[ns]').view(np.int64),
+            ended_ns=np.array(ended, dtype='datetime64[ns]').view(np.int64),
+            durations=np.array(durations, dtype=np.float64),
+            confidences=np.array(confidences, dtype=np.float64),
+            texts=list(texts)
+        )
     
     # =========================================================================
     # Speaking Pattern Analysis
@@ -38,48 +194,87 @@ class ConversationAnalyzer:
         Returns:
             Dict with speaking time, utterance counts, and distribution metrics
         """
-        utterances = self.utterance_repo.get_utterances_by_session(session_id)
-        
-        if not utterances:
+        rows = self.utterance_repo.aggregate_by_user(session_id)
+        if not rows:
             return {
                 'total_utterances': 0,
                 'total_speaking_time': 0,
                 'participants': {}
             }
         
-        # Aggregate by user
-        user_stats = defaultdict(lambda: {
-            'utterance_count': 0,
-            'total_speaking_time': 0.0,
-            'avg_utterance_length': 0.0,
-            'confidence_scores': []
-        })
+        total_utterances = sum(row['utterance_count'] for row in rows)
+        total_speaking_time = float(sum(row['total_speaking_time'] for row in rows))
+        
+        user_stats = {}
+        top_speaker_id, top_speaking_time = None, -1.0
+        for row in rows:
+            count = row['utterance_count']
+            total = float(row['total_speaking_time'])
+            if total > top_speaking_time:
+                top_speaker_id, top_speaking_time = row['user_id'], total
+            user_stats[row['user_id']] = {
+                'utterance_count': count,
+                'total_speaking_time': total,
+                'avg_utterance_length': total / count,
+                'username': row['username'],
+                'avg_confidence': float(row['avg_confidence']),
+                'speaking_time_percentage': (
+                    total / total_speaking_time * 100 if total_speaking_time > 0 else 0.0
+                )
+            }
         
-        for utt in utterances:
-            stats = user_stats[utt.user_id]
-            stats['utterance_count'] += 1
-            stats['total_speaking_time'] += utt.audio_duration
-            stats['confidence_scores'].append(utt.confidence)
-            stats['username'] = utt.username
-        
-        # Calculate averages and percentages
-        total_speaking_time = sum(s['total_speaking_time'] for s in user_stats.values())
-        
-        for user_id, stats in user_stats.items():
-            stats['avg_utterance_length'] = (
-                stats['total_speaking_time'] / stats['utterance_count']
-            )
-            stats['avg_confidence'] = statistics.mean(stats['confidence_scores'])
-            stats['speaking_time_percentage'] = (
-                (stats['total_speaking_time'] / total_speaking_time * 100)
-                if total_speaking_time > 0 else 0
+        return {
+            'total_utterances': total_utterances,
+            'total_speaking_time': total_speaking_time,
+            'participants': user_stats,
+            'top_speaker_id': top_speaker_id,
+            'dominance_score': self._calculate_dominance_score(user_stats)
+        }
+    
+    def _speaking_patterns_prepared(self, prep: PreparedUtterances) -> Dict:
+        """Speaking pattern analysis over prepared utterance columns."""
+        if not prep.count:
+            return {
+                'total_utterances': 0,
+                'total_speaking_time': 0,
+                'participants': {}
+            }
+        
+        # Aggregate by user: sum per speaker code in C
+        codes = prep.user_codes
+        counts = np.bincount(codes)
+        speaking_time = np.bincount(codes, weights=prep.durations)
+        confidence_sum = np.bincount(codes, weights=prep.confidences)
+        
+        total_speaking_time = float(speaking_time.sum())
+        avg_length = speaking_time / counts
+        avg_confidence = confidence_sum / counts
+        percentage = (
+            speaking_time / total_speaking_time * 100
+            if total_speaking_time > 0 else np.zeros_like(speaking_time)
+        )
+        
+        user_stats = {
+            user_id: {
+                'utterance_count': count,
+                'total_speaking_time': total,
+                'avg_utterance_length': avg_len,
+                'username': username,
+                'avg_confidence': avg_conf,
+                'speaking_time_percentage': pct
+            }
+            for user_id, username, count, total, avg_len, avg_conf, pct in zip(
+                prep.unique_ids.tolist(), prep.names, counts.tolist(),
+                speaking_time.tolist(), avg_length.tolist(),
+                avg_confidence.tolist(), percentage.tolist()
             )
-            del stats['confidence_scores']  # Remove raw scores
+        }
         
         return {
-            'total_utterances': len(utterances),
+            'total_utterances': prep.count,
             'total_speaking_time': total_speaking_time,
-            'participants': dict(user_stats),
+            'participants': user_stats,
+            'top_speaker_id': int(prep.unique_ids[speaking_time.argmax()]),
             'dominance_score': self._calculate_dominance_score(user_stats)
         }
     
@@ -91,24 +286,24 @@ class ConversationAnalyzer:
         if not user_stats:
             return 0.0
         
-        speaking_times = [s['total_speaking_time'] for s in user_stats.values()]
-        
-        if len(speaking_times) < 2:
+        n = len(user_stats)
+        if n < 2:
             return 0.0
         
-        # Calculate Gini coefficient
+        # Gini coefficient: sum((2i - n - 1) * x_i) / (n * sum(x)) over sorted x
+        speaking_times = np.fromiter(
+            (s['total_speaking_time'] for s in user_stats.values()),
+            dtype=np.float64,
+            count=n
+        )
         speaking_times.sort()
-        n = len(speaking_times)
-        cumsum = 0
-        
-        for i, time in enumerate(speaking_times):
-            cumsum += (2 * (i + 1) - n - 1) * time
         
-        total_time = sum(speaking_times)
+        total_time = speaking_times.sum()
         if total_time == 0:
             return 0.0
         
-        return cumsum / (n * total_time)
+        coeff = 2 * np.arange(1, n + 1, dtype=np.float64) - n - 1
+        return float(coeff @ speaking_times) / (n * float(total_time))
     
     # =========================================================================
     # Turn-Taking Analysis
@@ -121,74 +316,75 @@ class ConversationAnalyzer:
         Returns:
             Transition matrix and turn-taking metrics
         """
-        utterances = self.utterance_repo.get_utterances_by_session(session_id)
-        
-        if len(utterances) < 2:
+        utterances = self._get_utterances_cached(session_id)
+        return self._turn_taking_prepared(self._prepare(utterances))
+    
+    def _turn_taking_prepared(self, prep: PreparedUtterances) -> Dict:
+        """Turn-taking analysis over prepared utterance columns."""
+        if prep.count < 2:
             return {
                 'transitions': {},
                 'turn_counts': {},
                 'avg_response_time': None
             }
         
-        # Build transition matrix
-        transitions = defaultdict(lambda: defaultdict(int))
-        response_times = []
-        turn_counts = defaultdict(int)
+        names = prep.names
+        k = len(names)
         
-        for i in range(len(utterances) - 1):
-            current = utterances[i]
-            next_utt = utterances[i + 1]
-            
-            # Count transition
-            transitions[current.user_id][next_utt.user_id] += 1
-            
-            # Count turns (when speaker changes)
-            if current.user_id != next_utt.user_id:
-                turn_counts[next_utt.user_id] += 1
-                
-                # Calculate response time
-                response_time = (next_utt.started_at - current.ended_at).total_seconds()
-                if 0 <= response_time <= 30:  # Filter outliers
-                    response_times.append(response_time)
+        # Dense K x K transition matrix from consecutive speaker pairs
+        prev, nxt = prep.user_codes[:-1], prep.user_codes[1:]
+        transitions = np.bincount(prev * k + nxt, minlength=k * k).reshape(k, k)
+        
+        # Turns (speaker changes) credited to the incoming speaker:
+        # inbound transitions minus self-loops
+        changed = prev != nxt
+        turn_counts = transitions.sum(axis=0) - np.diag(transitions)
+        
+        # Response times on speaker change, filtering outliers
+        gaps = (prep.started_ns[1:] - prep.ended_ns[:-1]) * 1e-9
+        response_times = gaps[changed & (gaps >= 0) & (gaps <= 30)]
         
         # Convert to regular dicts with usernames
-        user_id_to_name = {u.user_id: u.username for u in utterances}
-        
-        transitions_with_names = {}
-        for from_user, to_users in transitions.items():
-            from_name = user_id_to_name.get(from_user, str(from_user))
-            transitions_with_names[from_name] = {
-                user_id_to_name.get(to_user, str(to_user)): count
-                for to_user, count in to_users.items()
-            }
+        transitions_with_names = self._matrix_to_named_dict(transitions, names)
         
         turn_counts_with_names = {
-            user_id_to_name.get(user_id, str(user_id)): count
-            for user_id, count in turn_counts.items()
+            names[code]: count
+            for code, count in enumerate(turn_counts.tolist()) if count
         }
         
         return {
             'transitions': transitions_with_names,
             'turn_counts': turn_counts_with_names,
             'avg_response_time': (
-                statistics.mean(response_times) if response_times else None
+                float(response_times.mean()) if response_times.size else None
             ),
-            'response_time_stats': (
-                self._calculate_stats(response_times) if response_times else None
-            )
+            'response_time_stats': self._calculate_stats(response_times)
         }
     
-    def _calculate_stats(self, values: List[float]) -> Dict:
-        """Calculate statistical measures for a list of values."""
-        if not values:
+    def _matrix_to_named_dict(self, matrix: np.ndarray, names: List[str]) -> Dict[str, Dict[str, int]]:
+        """
+        Convert a dense K x K count matrix to a username-keyed dict-of-dicts.
+        
+        Only nonzero entries are visited; rows without any counts are omitted.
+        """
+        rows, cols = np.nonzero(matrix)
+        result: Dict[str, Dict[str, int]] = {}
+        for row, col, count in zip(rows.tolist(), cols.tolist(), matrix[rows, cols].tolist()):
+            result.setdefault(names[row], {})[names[col]] = count
+        return result
+    
+    def _calculate_stats(self, values) -> Dict:
+        """Calculate statistical measures for a sequence or array of values."""
+        arr = np.asarray(values, dtype=np.float64)
+        if arr.size == 0:
             return None
         
         return {
-            'mean': statistics.mean(values),
-            'median': statistics.median(values),
-            'stdev': statistics.stdev(values) if len(values) > 1 else 0,
-            'min': min(values),
-            'max': max(values)
+            'mean': float(arr.mean()),
+            'median': float(np.median(arr)),
+            'stdev': float(arr.std(ddof=1)) if arr.size > 1 else 0,
+            'min': float(arr.min()),
+            'max': float(arr.max())
         }
     
     # =========================================================================
@@ -203,50 +399,44 @@ class ConversationAnalyzer:
         Returns:
             Interaction graph and metrics
         """
-        utterances = self.utterance_repo.get_utterances_by_session(session_id)
-        
-        if len(utterances) < 2:
+        utterances = self._get_utterances_cached(session_id)
+        return self._interactions_prepared(self._prepare(utterances))
+    
+    def _interactions_prepared(self, prep: PreparedUtterances) -> Dict:
+        """Interaction analysis over prepared utterance columns."""
+        if prep.count < 2:
             return {
                 'interaction_graph': {},
-                'interaction_counts': {}
+                'interaction_counts': {},
+                'most_interactive': None
             }
         
-        # Build interaction graph
-        interactions = defaultdict(lambda: defaultdict(int))
-        interaction_window = timedelta(seconds=settings.analysis_interaction_window)
+        names = prep.names
+        k = len(names)
         
-        for i in range(len(utterances) - 1):
-            current = utterances[i]
-            next_utt = utterances[i + 1]
-            
-            # Check if within interaction window and different speakers
-            if (current.user_id != next_utt.user_id and
-                next_utt.started_at - current.ended_at <= interaction_window):
-                
-                # Bidirectional interaction
-                interactions[current.user_id][next_utt.user_id] += 1
-                interactions[next_utt.user_id][current.user_id] += 1
+        # Consecutive utterances by different speakers within the window
+        prev, nxt = prep.user_codes[:-1], prep.user_codes[1:]
+        gaps = (prep.started_ns[1:] - prep.ended_ns[:-1]) * 1e-9
+        close = (prev != nxt) & (gaps <= settings.analysis_interaction_window)
+        
+        # Bidirectional interaction counts as a symmetric K x K matrix
+        one_way = np.bincount(prev[close] * k + nxt[close], minlength=k * k).reshape(k, k)
+        interactions = one_way + one_way.T
         
         # Convert to usernames
-        user_id_to_name = {u.user_id: u.username for u in utterances}
-        
-        interaction_graph = {}
-        for user_id, partners in interactions.items():
-            username = user_id_to_name.get(user_id, str(user_id))
-            interaction_graph[username] = {
-                user_id_to_name.get(partner_id, str(partner_id)): count
-                for partner_id, count in partners.items()
-            }
+        interaction_graph = self._matrix_to_named_dict(interactions, names)
         
         # Calculate total interactions per user
+        totals = interactions.sum(axis=1)
         interaction_counts = {
-            username: sum(partners.values())
-            for username, partners in interaction_graph.items()
+            names[code]: count
+            for code, count in enumerate(totals.tolist()) if count
         }
         
         return {
             'interaction_graph': interaction_graph,
-            'interaction_counts': interaction_counts
+            'interaction_counts': interaction_counts,
+            'most_interactive': names[int(totals.argmax())] if interaction_counts else None
         }
     
     # =========================================================================
@@ -264,37 +454,17 @@ class ConversationAnalyzer:
         if top_n is None:
             top_n = settings.analysis_default_keyword_limit
         
-        utterances = self.utterance_repo.get_utterances_by_session(session_id)
-        
-        if not utterances:
+        utterances = self._get_utterances_cached(session_id)
+        return self._keywords_from_texts([u.text for u in utterances], top_n)
+    
+    def _keywords_from_texts(self, texts: List[str], top_n: int) -> List[Tuple[str, int]]:
+        """Keyword frequency extraction over utterance texts."""
+        if not texts:
             return []
         
-        # Common words to filter out
-        stopwords = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'is', 'was', 'are', 'were', 'been', 'be', 'have', 'has',
-            'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'can',
-            'may', 'might', 'must', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-            'this', 'that', 'these', 'those', 'my', 'your', 'his', 'her', 'its',
-            'our', 'their', 'me', 'him', 'her', 'us', 'them', 'what', 'which',
-            'who', 'when', 'where', 'why', 'how', 'all', 'each', 'every', 'both',
-            'few', 'more', 'most', 'other', 'some', 'such', 'no', 'not', 'only',
-            'own', 'same', 'so', 'than', 'too', 'very', 'just', 'like', 'yeah',
-            'um', 'uh', 'oh', 'okay', 'ok', 'well'
-        }
-        
-        # Collect all words
-        word_counts = Counter()
-        
-        for utt in utterances:
-            words = utt.text.lower().split()
-            for word in words:
-                # Basic cleaning
-                word = word.strip('.,!?;:"\'()[]{}')
-                
-                # Filter stopwords and short words
-                if len(word) > 2 and word not in stopwords and word.isalpha():
-                    word_counts[word] += 1
+        # Tokenize all texts in one regex pass and count in C
+        tokens = _keyword_tokens('\n'.join(texts))
+        word_counts = Counter(word for word in tokens if word not in _KEYWORD_STOPWORDS)
         
         return word_counts.most_common(top_n)
     
@@ -310,15 +480,18 @@ class ConversationAnalyzer:
             Complete analysis including all metrics
         """
         session = self.session_repo.get_session(session_id)
-        
         if not session:
             return {'error': 'Session not found'}
         
-        # Get all analyses
-        speaking_patterns = self.analyze_speaking_patterns(session_id)
-        turn_taking = self.analyze_turn_taking(session_id)
-        interactions = self.analyze_interactions(session_id)
-        keywords = self.extract_keywords(session_id, top_n=15)
+        utterances = self._get_utterances_cached(session_id)
+        
+        # Prepare utterances once, shared by all analyses
+        prep = self._prepare(utterances)
+        
+        speaking_patterns = self._speaking_patterns_prepared(prep)
+        turn_taking = self._turn_taking_prepared(prep)
+        interactions = self._interactions_prepared(prep)
+        keywords = self._keywords_from_texts(prep.texts, top_n=15)
         
         # Session metadata
         summary = {
@@ -373,12 +546,9 @@ class ConversationAnalyzer:
         
         # Most active speaker
         if speaking_patterns['participants']:
-            most_active = max(
-                speaking_patterns['participants'].items(),
-                key=lambda x: x[1]['total_speaking_time']
-            )
-            username = most_active[1]['username']
-            percentage = most_active[1]['speaking_time_percentage']
+            most_active = speaking_patterns['participants'][speaking_patterns['top_speaker_id']]
+            username = most_active['username']
+            percentage = most_active['speaking_time_percentage']
             insights.append(f"🎤 Most active speaker: {username} ({percentage:.1f}% of speaking time)")
         
         # Response time
@@ -391,13 +561,10 @@ class ConversationAnalyzer:
         
         # Interaction patterns
         if interactions['interaction_counts']:
-            most_interactive = max(
-                interactions['interaction_counts'].items(),
-                key=lambda x: x[1]
-            )
+            most_interactive = interactions['most_interactive']
             insights.append(
-                f"🤝 Most interactive participant: {most_interactive[0]} "
-                f"({most_interactive[1]} interactions)"
+                f"🤝 Most interactive participant: {most_interactive} "
+                f"({interactions['interaction_counts'][most_interactive]} interactions)"
             )
         
         # Session length
@@ -425,49 +592,31 @@ class ConversationAnalyzer:
         Returns:
             Trends and patterns for the user
         """
-        if session_ids:
-            utterances_by_session = {}
-            for sid in session_ids:
-                utterances_by_session[sid] = self.utterance_repo.get_utterances_by_user(
-                    user_id=user_id,
-                    session_id=sid
-                )
-        else:
-            # Get recent utterances
-            all_utterances = self.utterance_repo.get_utterances_by_user(
+        # Per-session totals aggregated in SQL
+        aggregates = {
+            row['session_id']: row
+            for row in self.utterance_repo.aggregate_by_session(
                 user_id=user_id,
-                limit=limit * 100  # Get more to group by session
+                session_ids=session_ids,
+                limit=limit
             )
-            
-            # Group by session
-            utterances_by_session = defaultdict(list)
-            for utt in all_utterances:
-                utterances_by_session[utt.session_id].append(utt)
+        }
+        
+        # Join with session metadata, fetched in one query ordered by start time
+        sessions = self.session_repo.get_sessions_by_ids(list(aggregates))
         
-        # Analyze each session
         session_stats = []
         
-        for session_id, utterances in utterances_by_session.items():
-            if not utterances:
-                continue
-            
-            session = self.session_repo.get_session(session_id)
-            if not session:
-                continue
-            
-            total_speaking_time = sum(u.audio_duration for u in utterances)
-            
+        for session_id, session in sessions.items():
+            row = aggregates[session_id]
             session_stats.append({
                 'session_id': session_id,
                 'date': session.started_at.date().isoformat(),
-                'utterance_count': len(utterances),
-                'speaking_time': total_speaking_time,
-                'avg_confidence': statistics.mean(u.confidence for u in utterances)
+                'utterance_count': row['utterance_count'],
+                'speaking_time': float(row['total_speaking_time']),
+                'avg_confidence': float(row['avg_confidence'])
             })
         
-        # Sort by date
-        session_stats.sort(key=lambda x: x['date'])
-        
         # Calculate trends
         if len(session_stats) >= 2:
             speaking_times = [s['speaking_time'] for s in session_stats]
@@ -496,13 +645,15 @@ class ConversationAnalyzer:
         Returns:
             Topic clusters with keywords and example utterances
         """
-        utterances = self.utterance_repo.get_utterances_by_session(session_id)
+        utterances = self._get_utterances_cached(session_id)
         
         if not utterances:
             return {'topics': [], 'topic_count': 0}
         
-        # Extract keywords with context
+        # Extract keywords with context and co-occurrences in one pass.
+        # Co-occurrence is symmetric, so only pairs with word1 < word2 are stored.
         keyword_contexts = defaultdict(list)
+        cooccurrence: Dict[str, Counter] = defaultdict(Counter)
         stopwords = self._get_stopwords()
         
         for utt in utterances:
@@ -516,17 +667,14 @@ class ConversationAnalyzer:
                     'username': utt.username,
                     'timestamp': utt.started_at
                 })
-        
-        # Build co-occurrence matrix
-        cooccurrence = defaultdict(lambda: defaultdict(int))
-        
-        for utt in utterances:
-            words = self._extract_words(utt.text, stopwords)
+            
             # Count co-occurrences within same utterance
             for i, word1 in enumerate(words):
                 for word2 in words[i+1:]:
-                    cooccurrence[word1][word2] += 1
-                    cooccurrence[word2][word1] += 1
+                    if word1 < word2:
+                        cooccurrence[word1][word2] += 1
+                    elif word2 < word1:
+                        cooccurrence[word2][word1] += 1
         
         # Cluster keywords into topics using simple greedy clustering
         topics = self._cluster_keywords(cooccurrence, keyword_contexts, num_topics)
@@ -537,37 +685,13 @@ class ConversationAnalyzer:
             'total_keywords': len(keyword_contexts)
         }
     
-    def _get_stopwords(self) -> Set[str]:
+    def _get_stopwords(self) -> FrozenSet[str]:
         """Get comprehensive stopword list."""
-        return {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'is', 'was', 'are', 'were', 'been', 'be', 'have', 'has',
-            'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'can',
-            'may', 'might', 'must', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-            'this', 'that', 'these', 'those', 'my', 'your', 'his', 'her', 'its',
-            'our', 'their', 'me', 'him', 'her', 'us', 'them', 'what', 'which',
-            'who', 'when', 'where', 'why', 'how', 'all', 'each', 'every', 'both',
-            'few', 'more', 'most', 'other', 'some', 'such', 'no', 'not', 'only',
-            'own', 'same', 'so', 'than', 'too', 'very', 'just', 'like', 'yeah',
-            'um', 'uh', 'oh', 'okay', 'ok', 'well', 'now', 'then', 'there', 'here',
-            'get', 'got', 'going', 'go', 'went', 'think', 'know', 'mean', 'see',
-            'said', 'say', 'really', 'actually', 'basically', 'literally'
-        }
+        return _TOPIC_STOPWORDS
     
     def _extract_words(self, text: str, stopwords: Set[str]) -> List[str]:
         """Extract meaningful words from text."""
-        words = text.lower().split()
-        cleaned = []
-        
-        for word in words:
-            # Clean punctuation
-            word = re.sub(r'[^a-z0-9]', '', word)
-            
-            # Filter
-            if len(word) > 2 and word not in stopwords and word.isalpha():
-                cleaned.append(word)
-        
-        return cleaned
+        return [word for word in _topic_tokens(text) if word not in stopwords]
     
     def _cluster_keywords(
         self,
@@ -576,9 +700,9 @@ class ConversationAnalyzer:
         num_topics: int
     ) -> List[Dict]:
         """Cluster keywords into topics using greedy approach."""
-        # Get most frequent keywords as seed topics
+        # Get most frequent keywords as seed topics (only num_topics are ever used)
         keyword_freq = {k: len(v) for k, v in keyword_contexts.items()}
-        seed_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)
+        seed_keywords = heapq.nlargest(num_topics, keyword_freq.items(), key=itemgetter(1))
         
         if len(seed_keywords) < num_topics:
             num_topics = len(seed_keywords)
@@ -594,14 +718,13 @@ class ConversationAnalyzer:
             if seed in used_keywords:
                 continue
             
-            # Find related keywords
-            related = []
-            if seed in cooccurrence:
-                related = sorted(
-                    cooccurrence[seed].items(),
-                    key=lambda x: x[1],
-                    reverse=True
-                )[:5]  # Top 5 related keywords
+            # Find related keywords from the seed's full (symmetric) row
+            partners = Counter(cooccurrence.get(seed) or {})
+            for word, row in cooccurrence.items():
+                if seed in row:
+                    partners[word] = row[seed]
+            
+            related = heapq.nlargest(5, partners.items(), key=itemgetter(1))  # Top 5 related keywords
             
             topic_keywords = [seed] + [k for k, _ in related if k not in used_keywords]
             topic_keywords = topic_keywords[:6]  # Max 6 keywords per topic
@@ -646,22 +769,25 @@ class ConversationAnalyzer:
             Conversation recap with timeline and highlights
         """
         session = self.session_repo.get_session(session_id)
-        utterances = self.utterance_repo.get_utterances_by_session(session_id)
+        utterances = self._get_utterances_cached(session_id)
         
         if not session or not utterances:
             return {'error': 'No data available'}
         
         # Build timeline segments (5-minute chunks)
-        timeline = self._build_timeline(utterances, session)
+        timeline = self._build_timeline(utterances, session, self._get_stopwords())
+        
+        # Columns shared by key moments, highlights and the participant summary
+        prep = self._prepare(utterances)
         
         # Identify key moments (high activity, topic shifts)
-        key_moments = self._identify_key_moments(utterances)
+        key_moments = self._identify_key_moments(utterances, prep)
         
         # Get most quoted/referenced utterances
-        highlights = self._find_highlights(utterances)
+        highlights = self._find_highlights(utterances, prep)
         
         # Participant summary
-        participants = self._summarize_participants(utterances)
+        participants = self._summarize_participants(prep)
         
         return {
             'session_id': session_id,
@@ -674,7 +800,12 @@ class ConversationAnalyzer:
             'total_utterances': len(utterances)
         }
     
-    def _build_timeline(self, utterances: List[Utterance], session: Session) -> List[Dict]:
+    def _build_timeline(
+        self,
+        utterances: List[Utterance],
+        session: Session,
+        stopwords: FrozenSet[str]
+    ) -> List[Dict]:
         """Build timeline of conversation in segments."""
         if not utterances:
             return []
@@ -693,7 +824,8 @@ class ConversationAnalyzer:
                     timeline.append(self._create_timeline_segment(
                         segment_utterances,
                         current_segment_start,
-                        len(timeline) + 1
+                        len(timeline) + 1,
+                        stopwords
                     ))
                 
                 # Start new segment
@@ -707,7 +839,8 @@ class ConversationAnalyzer:
             timeline.append(self._create_timeline_segment(
                 segment_utterances,
                 current_segment_start,
-                len(timeline) + 1
+                len(timeline) + 1,
+                stopwords
             ))
         
         return timeline
@@ -716,16 +849,16 @@ class ConversationAnalyzer:
         self,
         utterances: List[Utterance],
         start_time: datetime,
-        segment_num: int
+        segment_num: int,
+        stopwords: FrozenSet[str]
     ) -> Dict:
         """Create a timeline segment summary."""
-        # Get top keywords for this segment
-        word_counts = Counter()
-        stopwords = self._get_stopwords()
-        
-        for utt in utterances:
-            words = self._extract_words(utt.text, stopwords)
-            word_counts.update(words)
+        # Get top keywords for this segment, counted in one batch update
+        word_counts = Counter(
+            word
+            for word in _topic_tokens('\n'.join(utt.text for utt in utterances))
+            if word not in stopwords
+        )
         
         top_keywords = [w for w, _ in word_counts.most_common(3)]
         
@@ -741,56 +874,79 @@ class ConversationAnalyzer:
             'sample_text': utterances[0].text[:100] if utterances else ''
         }
     
-    def _identify_key_moments(self, utterances: List[Utterance]) -> List[Dict]:
+    def _identify_key_moments(self, utterances: List[Utterance], prep: PreparedUtterances) -> List[Dict]:
         """Identify key moments in conversation (high activity, topic shifts)."""
-        if len(utterances) < 10:
+        if prep.count < 10:
             return []
         
         key_moments = []
         window_size = 10
+        step = window_size // 2
+        
+        # Speaker changes and gaps between consecutive utterances, for all windows
+        changed = prep.user_codes[1:] != prep.user_codes[:-1]
+        gaps = (prep.started_ns[1:] - prep.ended_ns[:-1]) * 1e-9
+        speaker_counts = self._window_speaker_counts(prep.user_codes, window_size, step)
         
         # Find high-activity windows
-        for i in range(0, len(utterances) - window_size, window_size // 2):
-            window = utterances[i:i+window_size]
+        for i, unique_speakers in zip(
+            range(0, prep.count - window_size, step), speaker_counts.tolist()
+        ):
+            if unique_speakers < 3:
+                continue
             
-            # Calculate activity score
-            unique_speakers = len(set(u.user_id for u in window))
-            avg_response_time = self._calc_avg_response_time(window)
+            # Calculate activity score over the window's consecutive pairs
+            avg_response_time = self._calc_avg_response_time(
+                changed[i:i+window_size-1], gaps[i:i+window_size-1]
+            )
             
             # High activity = multiple speakers + fast responses
-            if unique_speakers >= 3 and avg_response_time and avg_response_time < 2.0:
+            if avg_response_time and avg_response_time < 2.0:
                 key_moments.append({
                     'type': 'high_activity',
-                    'timestamp': window[0].started_at.strftime('%H:%M:%S'),
+                    'timestamp': utterances[i].started_at.strftime('%H:%M:%S'),
                     'description': f'{unique_speakers} speakers in rapid exchange',
-                    'sample': window[0].text[:80]
+                    'sample': utterances[i].text[:80]
                 })
         
         return key_moments[:5]  # Top 5 key moments
     
-    def _calc_avg_response_time(self, utterances: List[Utterance]) -> Optional[float]:
-        """Calculate average response time for utterances."""
-        if len(utterances) < 2:
-            return None
+    def _window_speaker_counts(self, codes: np.ndarray, window_size: int, step: int) -> np.ndarray:
+        """
+        Count distinct speakers in fixed-size windows of utterances.
         
-        times = []
-        for i in range(len(utterances) - 1):
-            if utterances[i].user_id != utterances[i+1].user_id:
-                rt = (utterances[i+1].started_at - utterances[i].ended_at).total_seconds()
-                if 0 <= rt <= 30:
-                    times.append(rt)
+        Windows start at 0, step, 2*step, ... and must end before the last
+        utterance, i.e. one per start in range(0, len(codes) - window_size, step).
         
-        return statistics.mean(times) if times else None
+        Returns:
+            Distinct speaker count per window
+        """
+        num_windows = len(range(0, len(codes) - window_size, step))
+        if not num_windows:
+            return np.zeros(0, dtype=np.int64)
+        
+        # Sort each window's codes; distinct count = 1 + number of value changes
+        windows = np.sort(
+            np.lib.stride_tricks.sliding_window_view(codes, window_size)[::step][:num_windows],
+            axis=1
+        )
+        return 1 + np.count_nonzero(np.diff(windows, axis=1), axis=1)
+    
+    def _calc_avg_response_time(self, changed: np.ndarray, gaps: np.ndarray) -> Optional[float]:
+        """Average response time over speaker changes, ignoring gaps outside 0-30s."""
+        times = gaps[changed & (gaps >= 0) & (gaps <= 30)]
+        return float(times.mean()) if times.size else None
     
-    def _find_highlights(self, utterances: List[Utterance]) -> List[Dict]:
+    def _find_highlights(self, utterances: List[Utterance], prep: PreparedUtterances) -> List[Dict]:
         """Find highlight utterances (longest, most confident, etc.)."""
         if not utterances:
             return []
         
         highlights = []
         
-        # Longest utterance
-        longest = max(utterances, key=lambda u: len(u.text))
+        # Longest utterance (first on ties, like max())
+        text_lengths = np.fromiter(map(len, prep.texts), dtype=np.int64, count=prep.count)
+        longest = utterances[int(text_lengths.argmax())]
         if len(longest.text) > 50:
             highlights.append({
                 'type': 'longest',
@@ -800,7 +956,7 @@ class ConversationAnalyzer:
             })
         
         # Most confident transcription
-        most_confident = max(utterances, key=lambda u: u.confidence)
+        most_confident = utterances[int(prep.confidences.argmax())]
         if most_confident.confidence > 0.9:
             highlights.append({
                 'type': 'clearest',
@@ -812,28 +968,30 @@ class ConversationAnalyzer:
         
         return highlights
     
-    def _summarize_participants(self, utterances: List[Utterance]) -> List[Dict]:
+    def _summarize_participants(self, prep: PreparedUtterances) -> List[Dict]:
         """Summarize each participant's contribution."""
-        participant_stats = defaultdict(lambda: {
-            'utterance_count': 0,
-            'total_words': 0,
-            'speaking_time': 0.0
-        })
+        codes = prep.user_codes
+        k = len(prep.names)
         
-        for utt in utterances:
-            stats = participant_stats[utt.username]
-            stats['utterance_count'] += 1
-            stats['total_words'] += len(utt.text.split())
-            stats['speaking_time'] += utt.audio_duration
+        # Accumulate per speaker code into dense arrays
+        word_counts = np.fromiter(
+            (len(text.split()) for text in prep.texts), dtype=np.int64, count=prep.count
+        )
+        utterance_counts = np.bincount(codes, minlength=k)
+        total_words = np.bincount(codes, weights=word_counts, minlength=k)
+        speaking_time = np.bincount(codes, weights=prep.durations, minlength=k)
         
         return [
             {
                 'username': username,
-                'utterances': stats['utterance_count'],
-                'words': stats['total_words'],
-                'speaking_time_seconds': round(stats['speaking_time'], 1)
+                'utterances': count,
+                'words': int(words),
+                'speaking_time_seconds': round(seconds, 1)
             }
-            for username, stats in participant_stats.items()
+            for username, count, words, seconds in zip(
+                prep.names, utterance_counts.tolist(),
+                total_words.tolist(), speaking_time.tolist()
+            )
         ]
     
     # =========================================================================
@@ -848,22 +1006,25 @@ class ConversationAnalyzer:
         Returns:
             Social dynamics metrics and influence scores
         """
-        utterances = self.utterance_repo.get_utterances_by_session(session_id)
+        utterances = self._get_utterances_cached(session_id)
         
         if len(utterances) < 5:
             return {'error': 'Insufficient data for social dynamics analysis'}
         
+        # One columnar pass over the utterances feeds every metric below
+        prep = self._prepare(utterances)
+        
         # Calculate influence scores
-        influence = self._calculate_influence_scores(utterances)
+        influence = self._calculate_influence_scores(prep)
         
         # Analyze conversation flow
-        flow = self._analyze_conversation_flow(utterances)
+        flow = self._analyze_conversation_flow(prep)
         
         # Identify conversation roles
-        roles = self._identify_conversation_roles(utterances, influence)
+        roles = self._identify_conversation_roles(prep, influence)
         
         # Engagement metrics
-        engagement = self._calculate_engagement_metrics(utterances)
+        engagement = self._calculate_engagement_metrics(prep)
         
         return {
             'influence_scores': influence,
@@ -872,55 +1033,55 @@ class ConversationAnalyzer:
             'engagement_metrics': engagement
         }
     
-    def _calculate_influence_scores(self, utterances: List[Utterance]) -> Dict:
+    def _calculate_influence_scores(self, prep: PreparedUtterances) -> List[Dict]:
         """
         Calculate influence scores based on:
         - How often others respond to you
         - How quickly others respond
         - How long others speak after you speak
         """
-        user_influence = defaultdict(lambda: {
-            'response_count': 0,
-            'avg_response_time': [],
-            'triggered_speaking_time': 0.0,
-            'username': ''
-        })
-        
-        for i in range(len(utterances) - 1):
-            current = utterances[i]
-            next_utt = utterances[i + 1]
-            
-            # Different speaker = potential influence
-            if current.user_id != next_utt.user_id:
-                influence = user_influence[current.user_id]
-                influence['username'] = current.username
-                influence['response_count'] += 1
-                
-                # Response time
-                rt = (next_utt.started_at - current.ended_at).total_seconds()
-                if 0 <= rt <= 30:
-                    influence['avg_response_time'].append(rt)
-                
-                # Speaking time triggered
-                influence['triggered_speaking_time'] += next_utt.audio_duration
+        k = len(prep.names)
+        
+        # A speaker change credits the previous speaker with a response
+        prev, nxt = prep.user_codes[:-1], prep.user_codes[1:]
+        changed = prev != nxt
+        responders = prev[changed]
+        response_counts = np.bincount(responders, minlength=k)
+        triggered_time = np.bincount(
+            responders, weights=prep.durations[1:][changed], minlength=k
+        )
+        
+        # Response times on speaker change, filtering outliers
+        gaps = (prep.started_ns[1:] - prep.ended_ns[:-1]) * 1e-9
+        valid = changed & (gaps >= 0) & (gaps <= 30)
+        rt_counts = np.bincount(prev[valid], minlength=k)
+        rt_sums = np.bincount(prev[valid], weights=gaps[valid], minlength=k)
+        
+        # Calculate final scores for speakers who drew at least one response
+        response_counts = response_counts.tolist()
+        triggered_time = triggered_time.tolist()
+        rt_counts = rt_counts.tolist()
+        rt_sums = rt_sums.tolist()
         
-        # Calculate final scores
         scores = []
-        for user_id, data in user_influence.items():
-            avg_rt = statistics.mean(data['avg_response_time']) if data['avg_response_time'] else None
+        for code in range(k):
+            if not response_counts[code]:
+                continue
+            
+            avg_rt = rt_sums[code] / rt_counts[code] if rt_counts[code] else None
             
             # Influence score: more responses + faster responses + more triggered speech = higher influence
-            score = data['response_count'] * 10
+            score = response_counts[code] * 10
             if avg_rt:
                 score += max(0, 10 - avg_rt)  # Faster response = higher score
-            score += data['triggered_speaking_time'] / 10
+            score += triggered_time[code] / 10
             
             scores.append({
-                'username': data['username'],
+                'username': prep.names[code],
                 'influence_score': round(score, 1),
-                'responses_triggered': data['response_count'],
+                'responses_triggered': response_counts[code],
                 'avg_response_time': round(avg_rt, 2) if avg_rt else None,
-                'speaking_time_triggered': round(data['triggered_speaking_time'], 1)
+                'speaking_time_triggered': round(triggered_time[code], 1)
             })
         
         # Sort by influence score
@@ -928,61 +1089,60 @@ class ConversationAnalyzer:
         
         return scores
     
-    def _analyze_conversation_flow(self, utterances: List[Utterance]) -> Dict:
+    def _analyze_conversation_flow(self, prep: PreparedUtterances) -> Dict:
         """Analyze how conversation flows between participants."""
-        # Build flow graph
-        flow_graph = defaultdict(lambda: defaultdict(int))
-        
-        for i in range(len(utterances) - 1):
-            from_user = utterances[i].username
-            to_user = utterances[i + 1].username
-            if from_user != to_user:
-                flow_graph[from_user][to_user] += 1
-        
-        # Find dominant flows
-        dominant_flows = []
-        for from_user, to_users in flow_graph.items():
-            for to_user, count in to_users.items():
-                if count >= 3:  # At least 3 exchanges
-                    dominant_flows.append({
-                        'from': from_user,
-                        'to': to_user,
-                        'exchanges': count
-                    })
-        
-        dominant_flows.sort(key=lambda x: x['exchanges'], reverse=True)
+        names = prep.names
+        k = len(names)
+        
+        # Build flow graph: K x K counts of speaker changes
+        prev, nxt = prep.user_codes[:-1], prep.user_codes[1:]
+        changed = prev != nxt
+        flow_graph = np.bincount(
+            prev[changed] * k + nxt[changed], minlength=k * k
+        ).reshape(k, k)
+        
+        # Find the top 5 dominant flows (at least 3 exchanges)
+        from_codes, to_codes = np.nonzero(flow_graph >= 3)
+        dominant_flows = heapq.nlargest(
+            5,
+            (
+                {
+                    'from': names[from_code],
+                    'to': names[to_code],
+                    'exchanges': count
+                }
+                for from_code, to_code, count in zip(
+                    from_codes.tolist(), to_codes.tolist(),
+                    flow_graph[from_codes, to_codes].tolist()
+                )
+            ),
+            key=itemgetter('exchanges')
+        )
         
         return {
-            'dominant_flows': dominant_flows[:5],
-            'total_exchanges': sum(sum(to_users.values()) for to_users in flow_graph.values())
+            'dominant_flows': dominant_flows,
+            'total_exchanges': int(changed.sum())
         }
     
-    def _identify_conversation_roles(self, utterances: List[Utterance], influence: List[Dict]) -> List[Dict]:
+    def _identify_conversation_roles(self, prep: PreparedUtterances, influence: List[Dict]) -> List[Dict]:
         """Identify conversation roles: leader, supporter, observer, etc."""
-        user_stats = defaultdict(lambda: {
-            'utterances': 0,
-            'speaking_time': 0.0,
-            'responses_given': 0,
-            'username': ''
-        })
-        
-        # Gather stats
-        for i, utt in enumerate(utterances):
-            stats = user_stats[utt.user_id]
-            stats['username'] = utt.username
-            stats['utterances'] += 1
-            stats['speaking_time'] += utt.audio_duration
-            
-            # Count responses given
-            if i > 0 and utterances[i-1].user_id != utt.user_id:
-                stats['responses_given'] += 1
+        codes = prep.user_codes
+        k = len(prep.names)
+        
+        # Gather stats: utterances per speaker, and responses given
+        # (utterances that follow a different speaker)
+        utterance_counts = np.bincount(codes, minlength=k)
+        changed = codes[1:] != codes[:-1]
+        responses_given = np.bincount(codes[1:][changed], minlength=k)
         
         # Assign roles
         roles = []
-        total_utterances = len(utterances)
+        total_utterances = prep.count
         
-        for user_id, stats in user_stats.items():
-            participation_rate = stats['utterances'] / total_utterances
+        for username, count, responses in zip(
+            prep.names, utterance_counts.tolist(), responses_given.tolist()
+        ):
+            participation_rate = count / total_utterances
             
             # Determine role
             if participation_rate > 0.4:
@@ -991,7 +1151,7 @@ class ConversationAnalyzer:
             elif participation_rate > 0.25:
                 role = 'Active Participant'
                 description = 'Highly engaged'
-            elif stats['responses_given'] > stats['utterances'] * 0.7:
+            elif responses > count * 0.7:
                 role = 'Responder'
                 description = 'Primarily responds to others'
             elif participation_rate < 0.1:
@@ -1002,7 +1162,7 @@ class ConversationAnalyzer:
                 description = 'Balanced participation'
             
             roles.append({
-                'username': stats['username'],
+                'username': username,
                 'role': role,
                 'description': description,
                 'participation_rate': round(participation_rate * 100, 1)
@@ -1010,40 +1170,35 @@ class ConversationAnalyzer:
         
         return roles
     
-    def _calculate_engagement_metrics(self, utterances: List[Utterance]) -> Dict:
+    def _calculate_engagement_metrics(self, prep: PreparedUtterances) -> Dict:
         """Calculate overall engagement metrics."""
-        if not utterances:
+        if not prep.count:
             return {}
         
-        # Calculate gaps between utterances
-        gaps = []
-        for i in range(len(utterances) - 1):
-            gap = (utterances[i+1].started_at - utterances[i].ended_at).total_seconds()
-            if 0 <= gap <= 60:  # Filter outliers
-                gaps.append(gap)
+        # Calculate gaps between utterances, filtering outliers
+        gaps = (prep.started_ns[1:] - prep.ended_ns[:-1]) * 1e-9
+        gaps = gaps[(gaps >= 0) & (gaps <= 60)]
         
-        # Unique speakers per time window
+        # Unique speakers per non-overlapping window of utterances
         window_size = 10
-        speaker_diversity = []
-        for i in range(0, len(utterances) - window_size, window_size):
-            window = utterances[i:i+window_size]
-            unique_speakers = len(set(u.user_id for u in window))
-            speaker_diversity.append(unique_speakers)
+        speaker_diversity = self._window_speaker_counts(prep.user_codes, window_size, window_size)
         
         return {
-            'avg_gap_between_utterances': round(statistics.mean(gaps), 2) if gaps else None,
-            'median_gap': round(statistics.median(gaps), 2) if gaps else None,
-            'avg_speaker_diversity': round(statistics.mean(speaker_diversity), 1) if speaker_diversity else None,
+            'avg_gap_between_utterances': round(float(gaps.mean()), 2) if gaps.size else None,
+            'median_gap': round(float(np.median(gaps)), 2) if gaps.size else None,
+            'avg_speaker_diversity': (
+                round(float(speaker_diversity.mean()), 1) if speaker_diversity.size else None
+            ),
             'engagement_score': self._calculate_engagement_score(gaps, speaker_diversity)
         }
     
-    def _calculate_engagement_score(self, gaps: List[float], diversity: List[int]) -> str:
+    def _calculate_engagement_score(self, gaps: np.ndarray, diversity: np.ndarray) -> str:
         """Calculate overall engagement score."""
-        if not gaps or not diversity:
+        if not gaps.size or not diversity.size:
             return 'Unknown'
         
-        avg_gap = statistics.mean(gaps)
-        avg_diversity = statistics.mean(diversity)
+        avg_gap = float(gaps.mean())
+        avg_diversity = float(diversity.mean())
         
         # High engagement: short gaps + high diversity
         if avg_gap < 2.0 and avg_diversity >= 3:
@@ -1,6 +1,8 @@
 """Boundary detection service for creating ideas from utterances."""
-from typing import Dict, List, Optional
+from typing import Dict, Deque, Optional, NamedTuple
+from collections import deque
 from datetime import datetime, timedelta
+import asyncio
 import logging
 
 from src.repositories.idea_repo import IdeaRepository
@@ -10,6 +12,14 @@ from src.config import settings
 logger = logging.getLogger(__name__)
 
 
+class PendingUtterance(NamedTuple):
+    """The utterance fields an idea is built from, detached from the ORM instance."""
+    id: int
+    text: str
+    started_at: datetime
+    ended_at: datetime
+
+
 class BoundaryDetector:
     """Detects idea boundaries and creates ideas in Qdrant."""
     
@@ -31,8 +41,69 @@ class BoundaryDetector:
         self.queue_repo = queue_repo
         self.exchange_detector = exchange_detector
         
-        # session_id -> {user_id -> [utterances]}
-        self._pending_utterances: Dict[str, Dict[int, List]] = {}
+        # session_id -> {user_id -> [pending utterances]}
+        self._pending_utterances: Dict[str, Dict[int, Deque[PendingUtterance]]] = {}
+        
+        # Utterances awaiting boundary checks, consumed by a single worker
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker_task: Optional[asyncio.Task] = None
+    
+    async def start(self) -> None:
+        """Start the worker that processes submitted utterances."""
+        if self._worker_task:
+            logger.warning("Boundary detector worker already running")
+            return
+        
+        self._loop = asyncio.get_running_loop()
+        self._worker_task = asyncio.create_task(self._worker_loop())
+        logger.info("Started boundary detector worker")
+    
+    async def stop(self) -> None:
+        """Stop the worker."""
+        if self._worker_task:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+            self._loop = None
+            logger.info("Stopped boundary detector worker")
+    
+    def submit(self, utterance) -> bool:
+        """
+        Queue a saved utterance for boundary detection.
+        
+        Safe to call from any thread; the utterance is handed to the
+        worker's event loop.
+        
+        Args:
+            utterance: UtteranceModel instance
+            
+        Returns:
+            True if queued, False if the worker is not running
+        """
+        if self._loop is None or not self._loop.is_running():
+            return False
+        
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, utterance)
+        return True
+    
+    async def _worker_loop(self) -> None:
+        """Process submitted utterances in arrival order."""
+        while True:
+            utterance = await self._queue.get()
+            try:
+                # Check for speaker change boundary, then process the utterance
+                await self.check_speaker_change(
+                    utterance.session_id, utterance.user_id, utterance.started_at
+                )
+                await self.on_utterance_created(utterance)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Boundary detection failed for utterance {utterance.id}: {e}", exc_info=True)
     
     async def on_utterance_created(self, utterance) -> None:
         """
@@ -45,27 +116,47 @@ class BoundaryDetector:
         session_id = utterance.session_id
         user_id = utterance.user_id
         
-        logger.debug(f"BoundaryDetector: Processing utterance {utterance.id} (session={session_id}, user={user_id})")
+        logger.debug("BoundaryDetector: Processing utterance %s (session=%s, user=%s)", utterance.id, session_id, user_id)
         
         # Initialize structures
         if session_id not in self._pending_utterances:
             self._pending_utterances[session_id] = {}
-            logger.debug(f"BoundaryDetector: Initialized session {session_id}")
+            logger.debug("BoundaryDetector: Initialized session %s", session_id)
         if user_id not in self._pending_utterances[session_id]:
-            self._pending_utterances[session_id][user_id] = []
-            logger.debug(f"BoundaryDetector: Initialized user {user_id} in session {session_id}")
+            self._pending_utterances[session_id][user_id] = deque(maxlen=settings.idea_max_utterances)
+            logger.debug("BoundaryDetector: Initialized user %s in session %s", user_id, session_id)
+        
+        pending = self._pending_utterances[session_id][user_id]
         
-        # Add to pending
-        self._pending_utterances[session_id][user_id].append(utterance)
-        pending_count = len(self._pending_utterances[session_id][user_id])
-        logger.debug(f"BoundaryDetector: Added utterance, now {pending_count} pending for user {user_id}")
+        # A full buffer means earlier idea creation failed; flush it rather than
+        # letting the deque silently evict the oldest utterance
+        if len(pending) == pending.maxlen:
+            logger.warning(
+                f"BoundaryDetector: {len(pending)} utterances pending for user {user_id} "
+                f"in session {session_id}, flushing into an idea"
+            )
+            await self._create_idea(session_id, user_id)
+            if len(pending) == pending.maxlen:
+                logger.warning(
+                    f"BoundaryDetector: Idea creation failed, dropping oldest pending "
+                    f"utterance {pending[0].id} for user {user_id}"
+                )
+        
+        # Add to pending, keeping only the fields ideas are built from
+        pending.append(PendingUtterance(
+            utterance.id, utterance.text, utterance.started_at, utterance.ended_at
+        ))
+        logger.debug(
+            "BoundaryDetector: Added utterance, now %d pending for user %s",
+            len(pending), user_id
+        )
         
         # Check if boundary reached
         if await self._is_boundary(session_id, user_id, utterance):
             logger.info(f"BoundaryDetector: Boundary detected for user {user_id}, creating idea...")
             await self._create_idea(session_id, user_id)
         else:
-            logger.debug(f"BoundaryDetector: No boundary yet, continuing to accumulate utterances")
+            logger.debug("BoundaryDetector: No boundary yet, continuing to accumulate utterances")
     
     async def flush_session(self, session_id: str) -> None:
         """
@@ -99,26 +190,28 @@ class BoundaryDetector:
             True if boundary detected, False otherwise
         """
         pending = self._pending_utterances[session_id][user_id]
+        count = len(pending)
         
-        if len(pending) == 0:
+        if count == 0:
             return False
         
-        # 1. Max duration threshold (ideas shouldn't be too long)
+        # 1. Multiple utterances - create idea after 3 utterances
+        # This is the primary boundary condition for normal conversation,
+        # and needs no timestamp arithmetic
+        if count >= 3:
+            logger.debug("Boundary: multiple utterances (%d)", count)
+            return True
+        
+        # 2. Max duration threshold (ideas shouldn't be too long)
         duration = (utterance.ended_at - pending[0].started_at).total_seconds()
         if duration >= settings.idea_max_duration_sec:
-            logger.debug(f"Boundary: max duration ({duration:.1f}s)")
+            logger.debug("Boundary: max duration (%.1fs)", duration)
             return True
         
-        # 2. Reasonable duration threshold (most ideas are 5-20 seconds)
+        # 3. Reasonable duration threshold (most ideas are 5-20 seconds)
         # After 15 seconds, be more aggressive about creating boundaries
-        if duration >= 15 and len(pending) >= 2:
-            logger.debug(f"Boundary: reasonable duration ({duration:.1f}s) with {len(pending)} utterances")
-            return True
-        
-        # 3. Multiple utterances - create idea after 3 utterances
-        # This is the primary boundary condition for normal conversation
-        if len(pending) >= 3:
-            logger.debug(f"Boundary: multiple utterances ({len(pending)})")
+        if duration >= 15 and count >= 2:
+            logger.debug("Boundary: reasonable duration (%.1fs) with %d utterances", duration, count)
             return True
         
         # Note: Speaker change and silence gaps are detected externally
@@ -157,7 +250,7 @@ class BoundaryDetector:
             gap_ms = (new_utterance_time - last_utterance.ended_at).total_seconds() * 1000
             
             if gap_ms >= settings.idea_boundary_silence_ms:
-                logger.debug(f"Boundary: speaker change + silence gap ({gap_ms:.0f}ms)")
+                logger.debug("Boundary: speaker change + silence gap (%.0fms)", gap_ms)
                 await self._create_idea(session_id, user_id)
     
     async def _create_idea(self, session_id: str, user_id: int) -> Optional[str]:
@@ -178,7 +271,7 @@ class BoundaryDetector:
         
         try:
             # Combine text
-            text = " ".join(u.text for u in pending)
+            text = " ".join([u.text for u in pending])
             utterance_ids = [u.id for u in pending]
             started_at = pending[0].started_at
             ended_at = pending[-1].ended_at
@@ -219,7 +312,7 @@ class BoundaryDetector:
                         logger.warning(f"   ✗ Failed to queue: {task_type}")
                 
                 # Clear pending
-                self._pending_utterances[session_id][user_id] = []
+                pending.clear()
                 
                 # Trigger exchange detection
                 if self.exchange_detector:
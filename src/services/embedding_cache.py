@@ -0,0 +1,135 @@
+"""Redis-backed embedding cache wrapping the Ollama client."""
+import logging
+from hashlib import blake2b
+from typing import Optional, List
+
+import numpy as np
+from redis.asyncio import Redis
+
+from src.services.ollama_client import OllamaClient
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Caches embedding vectors in Redis keyed by normalized text hash.
+
+    Exposes the same ``embed`` signature as OllamaClient so it can be passed
+    wherever an embedding client is expected. Vectors are stored as packed
+    float16 bytes to halve memory and bandwidth versus float32.
+    """
+
+    def __init__(
+        self,
+        ollama_client: OllamaClient,
+        redis_client: Redis,
+        ttl_sec: Optional[int] = None
+    ):
+        """
+        Initialize embedding cache.
+
+        Args:
+            ollama_client: OllamaClient used on cache misses
+            redis_client: Async Redis client
+            ttl_sec: Cache entry TTL in seconds (default from settings)
+        """
+        self.ollama = ollama_client
+        self.redis = redis_client
+        self.ttl_sec = ttl_sec or settings.embedding_cache_ttl_sec
+
+    @staticmethod
+    def _key(model: str, text: str) -> str:
+        """Build cache key from model name and normalized text."""
+        digest = blake2b(text.strip().lower().encode(), digest_size=16).hexdigest()
+        return f"emb:{model}:{digest}"
+
+    async def embed(
+        self,
+        model: str,
+        text: str
+    ) -> Optional[List[float]]:
+        """
+        Get embedding vector for text, consulting the cache first.
+
+        Args:
+            model: Embedding model name (e.g., 'nomic-embed-text')
+            text: Text to embed
+
+        Returns:
+            Embedding vector as list of floats, or None on failure
+        """
+        key = self._key(model, text)
+
+        try:
+            cached = await self.redis.get(key)
+            if cached is not None:
+                return np.frombuffer(cached, dtype=np.float16).astype(np.float32).tolist()
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+
+        embedding = await self.ollama.embed(model=model, text=text)
+        if not embedding:
+            return embedding
+
+        try:
+            packed = np.asarray(embedding, dtype=np.float16).tobytes()
+            await self.redis.set(key, packed, ex=self.ttl_sec)
+        except Exception as e:
+            logger.warning(f"Embedding cache store failed: {e}")
+
+        return embedding
+
+    async def embed_batch(
+        self,
+        model: str,
+        texts: List[str]
+    ) -> Optional[List[List[float]]]:
+        """
+        Get embedding vectors for several texts, embedding only cache misses.
+
+        Args:
+            model: Embedding model name (e.g., 'nomic-embed-text')
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in input order, or None on failure
+        """
+        if not texts:
+            return []
+
+        keys = [self._key(model, text) for text in texts]
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+
+        try:
+            for i, cached in enumerate(await self.redis.mget(keys)):
+                if cached is not None:
+                    embeddings[i] = np.frombuffer(cached, dtype=np.float16).astype(np.float32).tolist()
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+
+        misses = [i for i, emb in enumerate(embeddings) if emb is None]
+        if not misses:
+            return embeddings
+
+        fresh = await self.ollama.embed_batch(model=model, texts=[texts[i] for i in misses])
+        if not fresh:
+            return None
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for i, embedding in zip(misses, fresh):
+                    embeddings[i] = embedding
+                    pipe.set(keys[i], np.asarray(embedding, dtype=np.float16).tobytes(), ex=self.ttl_sec)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Embedding cache store failed: {e}")
+            for i, embedding in zip(misses, fresh):
+                embeddings[i] = embedding
+
+        return embeddings
+
+    async def close(self):
+        """Close the Redis connection."""
+        await self.redis.aclose()
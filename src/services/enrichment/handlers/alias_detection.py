@@ -1,5 +1,5 @@
 """Alias detection handler for identifying speaker mentions."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 import re
 
@@ -10,6 +10,22 @@ from src.repositories.idea_repo import IdeaRepository
 logger = logging.getLogger(__name__)
 
 
+def _compile_alias_pattern(alias_map: Dict[str, int]) -> Optional[re.Pattern]:
+    """
+    Compile one pattern matching any alias as a standalone word.
+    
+    Longer aliases are tried first so multi-word aliases win over their
+    prefixes. Returns None for an empty alias map.
+    """
+    if not alias_map:
+        return None
+    
+    alternation = '|'.join(
+        re.escape(alias) for alias in sorted(alias_map, key=len, reverse=True)
+    )
+    return re.compile(rf'(?<!\w)(?:{alternation})(?!\w)')
+
+
 class AliasDetectionHandler(BaseTaskHandler):
     """Detects speaker mentions in idea text using known aliases."""
     
@@ -31,46 +47,81 @@ class AliasDetectionHandler(BaseTaskHandler):
         """
         self.speaker_alias_repo = speaker_alias_repo
         self.idea_repo = idea_repo
+        # Compiled alias pattern and the alias-map version it was built from
+        self._alias_pattern: Optional[re.Pattern] = None
+        self._alias_pattern_version = -1
+    
+    def _get_alias_pattern(self, alias_map: Dict[str, int], version: int) -> Optional[re.Pattern]:
+        """
+        Get the compiled alias pattern, rebuilding it only when aliases change.
+        
+        Args:
+            alias_map: Map of lowercase alias -> user_id
+            version: Repository alias-map version read before alias_map was fetched
+            
+        Returns:
+            Compiled pattern, or None if there are no aliases
+        """
+        if version != self._alias_pattern_version:
+            self._alias_pattern = _compile_alias_pattern(alias_map)
+            # An empty map may be a failed load; don't pin it to this version
+            self._alias_pattern_version = version if alias_map else -1
+        return self._alias_pattern
     
     async def process(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process batch of ideas for alias detection."""
         # Get all aliases once for batch processing
+        alias_version = self.speaker_alias_repo.alias_map_version
         alias_map = self.speaker_alias_repo.get_all_aliases_map()
+        alias_pattern = self._get_alias_pattern(alias_map, alias_version)
+        
+        # Prefetch all ideas in the batch with one request
+        ideas = {
+            idea.id: idea
+            for idea in await self.idea_repo.get_ideas_async([item['target_id'] for item in items])
+        }
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        updates = []
+        pending = []  # (result index, target_id, mentions) awaiting the batch write
         
-        results = []
-        for item in items:
+        for index, item in enumerate(items):
             try:
-                idea = self.idea_repo.get_idea(item['target_id'])
+                idea = ideas.get(item['target_id'])
                 if not idea:
-                    results.append({'status': 'failed', 'error': 'Idea not found'})
+                    results[index] = {'status': 'failed', 'error': 'Idea not found'}
                     continue
                 
                 # Detect mentions
-                mentions = self._detect_mentions(idea.text, alias_map, idea.user_id)
+                mentions = self._detect_mentions(idea.text, alias_map, alias_pattern, idea.user_id)
                 
-                # Update idea
-                success = self.idea_repo.update_enrichments(
+                updates.append((
                     item['target_id'],
                     {
                         'mentions': mentions,
                         'enrichment_status.alias_detection': 'complete'
                     }
-                )
-                
-                if success:
-                    results.append({'status': 'complete'})
-                    if mentions:
-                        logger.info(f"✓ Alias Detection: Found {len(mentions)} mentions in idea {item['target_id']}")
-                        for mention in mentions:
-                            logger.info(f"   - '{mention['alias']}' → user {mention['resolved_user_id']}")
-                    else:
-                        logger.debug(f"✓ Alias Detection: No mentions found in idea {item['target_id']}")
-                else:
-                    results.append({'status': 'failed', 'error': 'Failed to update idea'})
+                ))
+                pending.append((index, item['target_id'], mentions))
                 
             except Exception as e:
                 logger.error(f"Alias detection failed for {item['target_id']}: {e}")
-                results.append({'status': 'failed', 'error': str(e)})
+                results[index] = {'status': 'failed', 'error': str(e)}
+        
+        # Update all ideas in one request
+        success = await self.idea_repo.bulk_update_enrichments_async(updates)
+        
+        for index, target_id, mentions in pending:
+            if success:
+                results[index] = {'status': 'complete'}
+                if mentions:
+                    logger.info(f"✓ Alias Detection: Found {len(mentions)} mentions in idea {target_id}")
+                    for mention in mentions:
+                        logger.info(f"   - '{mention['alias']}' → user {mention['resolved_user_id']}")
+                else:
+                    logger.debug(f"✓ Alias Detection: No mentions found in idea {target_id}")
+            else:
+                results[index] = {'status': 'failed', 'error': 'Failed to update idea'}
         
         return results
     
@@ -78,6 +129,7 @@ class AliasDetectionHandler(BaseTaskHandler):
         self,
         text: str,
         alias_map: Dict[str, int],
+        alias_pattern: Optional[re.Pattern],
         speaker_user_id: int
     ) -> List[Dict[str, Any]]:
         """
@@ -86,6 +138,7 @@ class AliasDetectionHandler(BaseTaskHandler):
         Args:
             text: Text to search for mentions
             alias_map: Map of lowercase alias -> user_id
+            alias_pattern: Compiled pattern matching any alias in alias_map
             speaker_user_id: User ID of speaker (to exclude self-mentions)
             
         Returns:
@@ -94,26 +147,27 @@ class AliasDetectionHandler(BaseTaskHandler):
         mentions = []
         seen_users = set()
         
-        # Tokenize text (simple word-based)
-        words = re.findall(r'\b\w+\b', text.lower())
+        if alias_pattern is None:
+            return mentions
         
-        for word in words:
-            if word in alias_map:
-                user_id = alias_map[word]
-                
-                # Skip self-mentions
-                if user_id == speaker_user_id:
-                    continue
-                
-                # Skip duplicates
-                if user_id in seen_users:
-                    continue
-                
-                mentions.append({
-                    'alias': word,
-                    'resolved_user_id': user_id,
-                    'confidence': 1.0
-                })
-                seen_users.add(user_id)
+        # Scan for every known alias in one pass, in text order
+        for match in alias_pattern.finditer(text.lower()):
+            alias = match.group()
+            user_id = alias_map[alias]
+            
+            # Skip self-mentions
+            if user_id == speaker_user_id:
+                continue
+            
+            # Skip duplicates
+            if user_id in seen_users:
+                continue
+            
+            mentions.append({
+                'alias': alias,
+                'resolved_user_id': user_id,
+                'confidence': 1.0
+            })
+            seen_users.add(user_id)
         
         return mentions
@@ -36,10 +36,16 @@ class IntentKeywordsHandler(BaseTaskHandler):
         """
         results = []
         
+        # Prefetch all ideas in the batch with one request
+        ideas = {
+            idea.id: idea
+            for idea in await self.idea_repo.get_ideas_async([item['target_id'] for item in items])
+        }
+        
         for item in items:
             try:
                 # Get idea
-                idea = await self.idea_repo.get_idea(item['target_id'])
+                idea = ideas.get(item['target_id'])
                 if not idea:
                     results.append({'status': 'failed', 'error': 'Idea not found'})
                     continue
@@ -48,7 +54,7 @@ class IntentKeywordsHandler(BaseTaskHandler):
                 intent, keywords = await self._extract_intent_keywords(idea.text)
                 
                 # Update idea
-                success = await self.idea_repo.update_enrichments(
+                success = await self.idea_repo.update_enrichments_async(
                     item['target_id'],
                     {
                         'intent': intent,
@@ -35,9 +35,15 @@ class ProsodyInterpretationHandler(BaseTaskHandler):
         """Process batch of ideas for prosody interpretation."""
         results = []
         
+        # Prefetch all ideas in the batch with one request
+        ideas = {
+            idea.id: idea
+            for idea in await self.idea_repo.get_ideas_async([item['target_id'] for item in items])
+        }
+        
         for item in items:
             try:
-                idea = self.idea_repo.get_idea(item['target_id'])
+                idea = ideas.get(item['target_id'])
                 if not idea:
                     results.append({'status': 'failed', 'error': 'Idea not found'})
                     continue
@@ -57,7 +63,7 @@ class ProsodyInterpretationHandler(BaseTaskHandler):
                 interpretation = self._interpret_prosody(utterances)
                 
                 # Update idea
-                success = self.idea_repo.update_enrichments(
+                success = await self.idea_repo.update_enrichments_async(
                     item['target_id'],
                     {
                         'prosody_interpretation': interpretation,
@@ -29,15 +29,21 @@ class ResponseMappingHandler(BaseTaskHandler):
         """Process batch of ideas for response mapping."""
         results = []
         
+        # Prefetch all ideas in the batch with one request
+        ideas = {
+            idea.id: idea
+            for idea in await self.idea_repo.get_ideas_async([item['target_id'] for item in items])
+        }
+        
         for item in items:
             try:
-                idea = self.idea_repo.get_idea(item['target_id'])
+                idea = ideas.get(item['target_id'])
                 if not idea:
                     results.append({'status': 'failed', 'error': 'Idea not found'})
                     continue
                 
                 # Find previous idea in session
-                previous_idea = self.idea_repo.get_previous_idea(
+                previous_idea = await self.idea_repo.get_previous_idea_async(
                     session_id=idea.session_id,
                     before_timestamp=idea.started_at,
                     user_id=idea.user_id  # Different speaker
@@ -63,7 +69,7 @@ class ResponseMappingHandler(BaseTaskHandler):
                 # Update idea
                 response_data['enrichment_status.response_mapping'] = 'complete'
                 
-                success = self.idea_repo.update_enrichments(
+                success = await self.idea_repo.update_enrichments_async(
                     item['target_id'],
                     response_data
                 )
@@ -46,7 +46,7 @@ class ExchangeDetector:
         """
         try:
             # Get the idea
-            idea = await self.idea_repo.get_idea(idea_id)
+            idea = await self.idea_repo.get_idea_async(idea_id)
             if not idea:
                 logger.warning(f"Idea {idea_id} not found for exchange detection")
                 return
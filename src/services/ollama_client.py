@@ -152,6 +152,45 @@ class OllamaClient:
             logger.error(f"Ollama embed failed: {e}")
             return None
     
+    async def embed_batch(
+        self,
+        model: str,
+        texts: List[str]
+    ) -> Optional[List[List[float]]]:
+        """
+        Generate embedding vectors for several texts in one request.
+        
+        Args:
+            model: Embedding model name (e.g., 'nomic-embed-text')
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors in input order, or None on failure
+        """
+        if not texts:
+            return []
+        
+        try:
+            session = await self._get_session()
+            
+            payload = {
+                "model": model,
+                "input": texts
+            }
+            
+            async with session.post(
+                f"{self.base_url}/api/embed",
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
+                return data.get('embeddings')
+                
+        except Exception as e:
+            logger.error(f"Ollama batch embed failed: {e}")
+            return None
+    
     async def chat(
         self,
         model: str,